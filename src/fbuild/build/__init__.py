@@ -8,11 +8,19 @@ This module provides the build system implementation including:
 - Build orchestration
 """
 
+from typing import TYPE_CHECKING
+
 from .source_scanner import SourceScanner, SourceCollection
 
+if TYPE_CHECKING:
+    from .orchestrator_esp32 import OrchestratorESP32
+
+# The ESP32 orchestrator pulls in the ESP32 toolchain, framework and library
+# stack, so it is only imported when first accessed (see __getattr__ below)
 __all__ = [
     'SourceScanner',
     'SourceCollection',
+    'OrchestratorESP32',
 ]
 
 # Import base classes
@@ -51,12 +59,6 @@ try:
 except ImportError:
     pass
 
-try:
-    from .orchestrator_esp32 import OrchestratorESP32  # noqa: F401
-    __all__.append('OrchestratorESP32')
-except ImportError:
-    pass
-
 try:
     from .binary_generator import BinaryGenerator  # noqa: F401
     __all__.append('BinaryGenerator')
@@ -115,3 +117,11 @@ try:
     __all__.append('BuildComponentFactory')
 except ImportError:
     pass
+
+
+def __getattr__(name: str):
+    """Import OrchestratorESP32 on first access."""
+    if name == 'OrchestratorESP32':
+        from .orchestrator_esp32 import OrchestratorESP32
+        return OrchestratorESP32
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,6 +14,8 @@ import subprocess
 from pathlib import Path
 from typing import List
 
+from .build_utils import quote_response_arg
+
 
 class ArchiveError(Exception):
     """Raised when archive creation operations fail."""
@@ -42,7 +44,8 @@ class ArchiveCreator:
         self,
         ar_path: Path,
         archive_path: Path,
-        object_files: List[Path]
+        object_files: List[Path],
+        thin: bool = False
     ) -> Path:
         """Create static library archive from object files.
 
@@ -50,6 +53,8 @@ class ArchiveCreator:
             ar_path: Path to archiver tool (ar)
             archive_path: Path for output .a file
             object_files: List of object file paths to archive
+            thin: Create a thin archive that references the object files in
+                place instead of copying them (objects must outlive the archive)
 
         Returns:
             Path to generated archive file
@@ -68,27 +73,36 @@ class ArchiveCreator:
         # Ensure archive directory exists
         archive_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Start from a fresh archive: ar refuses to convert between regular and
+        # thin archives, and 'r' would keep stale members from a previous build
+        if archive_path.exists():
+            archive_path.unlink()
+
+        # Pass object files through a response file to stay clear of command
+        # line length limits when archiving hundreds of objects
+        response_file = self._write_response_file(archive_path, object_files)
+
         # Build archiver command
         # 'rcs' flags: r=insert/replace, c=create, s=index (ranlib)
-        cmd = [str(ar_path), "rcs", str(archive_path)]
-        cmd.extend([str(obj) for obj in object_files])
+        # 'T' flag: thin archive (store member paths, not member contents)
+        cmd = [str(ar_path), "rcsT" if thin else "rcs", str(archive_path), f"@{response_file}"]
 
         # Execute archiver
         if self.show_progress:
             print(f"Creating {archive_path.name} archive from {len(object_files)} object files...")
 
         try:
+            # Capture raw bytes; output is only decoded on failure
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=60
             )
 
             if result.returncode != 0:
                 error_msg = f"Archive creation failed for {archive_path.name}\n"
-                error_msg += f"stderr: {result.stderr}\n"
-                error_msg += f"stdout: {result.stdout}"
+                error_msg += f"stderr: {result.stderr.decode('utf-8', errors='replace')}\n"
+                error_msg += f"stdout: {result.stdout.decode('utf-8', errors='replace')}"
                 raise ArchiveError(error_msg)
 
             if not archive_path.exists():
@@ -111,6 +125,26 @@ class ArchiveCreator:
                 raise
             raise ArchiveError(f"Failed to create archive {archive_path.name}: {e}") from e
 
+    def _write_response_file(self, archive_path: Path, object_files: List[Path]) -> Path:
+        """Write object file paths to a response file for ar.
+
+        Every path is quoted and escaped the way ar reads @file arguments,
+        so spaces, quotes and backslashes in paths are kept intact.
+
+        Args:
+            archive_path: Path of the archive being created
+            object_files: List of object file paths to archive
+
+        Returns:
+            Path to generated response file
+        """
+        response_file = archive_path.with_name(f"{archive_path.name}.rsp")
+
+        with open(response_file, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(quote_response_arg(str(obj)) for obj in object_files))
+
+        return response_file
+
     def create_core_archive(
         self,
         ar_path: Path,
@@ -119,7 +153,9 @@ class ArchiveCreator:
     ) -> Path:
         """Create core.a archive from core object files.
 
-        Convenience method for creating the standard core.a archive.
+        Convenience method for creating the standard core.a archive. The core
+        objects live in the build directory for the whole build, so core.a is
+        created as a thin archive to avoid copying every object into it.
 
         Args:
             ar_path: Path to archiver tool (ar)
@@ -133,4 +169,4 @@ class ArchiveCreator:
             ArchiveError: If archive creation fails
         """
         archive_path = build_dir / "core.a"
-        return self.create_archive(ar_path, archive_path, object_files)
+        return self.create_archive(ar_path, archive_path, object_files, thin=True)
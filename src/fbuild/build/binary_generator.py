@@ -7,12 +7,90 @@ Design:
     - Separates binary generation logic from linker
     - Supports both objcopy (AVR) and esptool (ESP32) workflows
     - Handles ESP32 bootloader and partition table generation
+    - Runs esptool in-process when importable to skip interpreter startup;
+      its output is captured per thread, so other threads keep printing
 """
 
+import contextlib
+import io
 import subprocess
 import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+# Serializes in-process esptool runs (esptool keeps module-level state)
+_esptool_lock = threading.Lock()
+
+# Guards installing the thread-aware stdout/stderr proxies
+_stream_install_lock = threading.Lock()
+
+
+class _ThreadCapturedStream:
+    """Proxy for sys.stdout/sys.stderr that captures writes per thread.
+
+    Writes from a thread inside capture() go to that thread's buffer; every
+    other thread keeps writing to the wrapped stream.
+    """
+
+    def __init__(self, stream: Any):
+        """Initialize the proxy.
+
+        Args:
+            stream: Stream that uncaptured writes go to
+        """
+        self._stream = stream
+        self._local = threading.local()
+
+    def _target(self) -> Any:
+        """Get the stream the current thread writes to."""
+        buffer = getattr(self._local, "buffer", None)
+        return self._stream if buffer is None else buffer
+
+    def write(self, text: str) -> int:
+        """Write text to the current thread's stream."""
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        """Flush the current thread's stream."""
+        self._target().flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+    @contextlib.contextmanager
+    def capture(self, buffer: io.StringIO) -> Iterator[None]:
+        """Send the current thread's writes to buffer while in the block.
+
+        Args:
+            buffer: Buffer receiving this thread's output
+        """
+        self._local.buffer = buffer
+        try:
+            yield
+        finally:
+            self._local.buffer = None
+
+
+def _get_captured_stream(name: str) -> _ThreadCapturedStream:
+    """Get the thread-aware proxy for sys.stdout or sys.stderr.
+
+    The proxy is installed on first use (or when the stream was replaced
+    since, e.g. by a test harness) and then left in place, so removing it
+    can never race with another thread's capture.
+
+    Args:
+        name: "stdout" or "stderr"
+
+    Returns:
+        The installed proxy
+    """
+    with _stream_install_lock:
+        stream = getattr(sys, name)
+        if not isinstance(stream, _ThreadCapturedStream):
+            stream = _ThreadCapturedStream(stream)
+            setattr(sys, name, stream)
+        return stream
 
 
 class BinaryGeneratorError(Exception):
@@ -20,6 +98,26 @@ class BinaryGeneratorError(Exception):
     pass
 
 
+def normalize_flash_freq(flash_freq: Any) -> str:
+    """Normalize flash frequency to esptool format.
+
+    Args:
+        flash_freq: Flash frequency (int/float in Hz, or string like "80m" or "80000000L")
+
+    Returns:
+        Normalized frequency string (e.g., "80m")
+    """
+    if isinstance(flash_freq, (int, float)):
+        # Convert Hz to MHz format like "80m"
+        return f"{int(flash_freq // 1000000)}m"
+    elif isinstance(flash_freq, str) and flash_freq.endswith('L'):
+        # Handle string representation of long integers like "80000000L"
+        freq_value = int(flash_freq.rstrip('L'))
+        return f"{freq_value // 1000000}m"
+    else:
+        return str(flash_freq)
+
+
 class BinaryGenerator:
     """Handles firmware binary generation from ELF files.
 
@@ -29,6 +127,10 @@ class BinaryGenerator:
     - ESP32 partitions.bin generation
     """
 
+    # MCUs whose second-stage bootloader must be imaged in DIO mode
+    # (see generate_bootloader)
+    DIO_BOOTLOADER_MCUS = frozenset({"esp32c6", "esp32c3", "esp32c2", "esp32h2"})
+
     def __init__(
         self,
         mcu: str,
@@ -54,6 +156,13 @@ class BinaryGenerator:
         self.toolchain = toolchain
         self.framework = framework
         self.show_progress = show_progress
+        self.is_esp32 = mcu.startswith("esp32")
+
+        # Flash parameters from board config, read and normalized once
+        build = board_config.get("build", {})
+        self.flash_mode = build.get("flash_mode", "dio")
+        self.flash_freq = normalize_flash_freq(build.get("f_flash", "80m"))
+        self.flash_size = build.get("flash_size", "4MB")
 
     def generate_bin(self, elf_path: Path, output_bin: Optional[Path] = None) -> Path:
         """Generate firmware.bin from firmware.elf.
@@ -77,7 +186,7 @@ class BinaryGenerator:
 
         # For ESP32 platforms, use esptool.py elf2image instead of objcopy
         # This generates a properly formatted ESP32 flash image without memory gaps
-        if self.mcu.startswith("esp32"):
+        if self.is_esp32:
             return self._generate_bin_esp32(elf_path, output_bin)
         else:
             return self._generate_bin_objcopy(elf_path, output_bin)
@@ -95,48 +204,16 @@ class BinaryGenerator:
         Raises:
             BinaryGeneratorError: If conversion fails
         """
-        # Get chip type from MCU
-        chip = self.mcu  # e.g., "esp32c6", "esp32s3"
-
-        # Get flash parameters from board config
-        flash_mode = self.board_config.get("build", {}).get("flash_mode", "dio")
-        flash_freq = self.board_config.get("build", {}).get("f_flash", "80m")
-        flash_size = self.board_config.get("build", {}).get("flash_size", "4MB")
-
-        # Convert frequency to esptool format if needed
-        flash_freq = self._normalize_flash_freq(flash_freq)
-
-        # Build esptool.py elf2image command
-        cmd = [
-            sys.executable,
-            "-m",
-            "esptool",
-            "--chip",
-            chip,
-            "elf2image",
-            "--flash-mode",
-            flash_mode,
-            "--flash-freq",
-            flash_freq,
-            "--flash-size",
-            flash_size,
-            "--elf-sha256-offset",
-            "0xb0",
-            "-o",
-            str(output_bin),
-            str(elf_path)
-        ]
+        # Build esptool.py elf2image arguments
+        args = self._elf2image_args(
+            elf_path, output_bin, self.flash_mode, elf_sha256_offset="0xb0"
+        )
 
         if self.show_progress:
             print("Generating firmware.bin using esptool.py elf2image...")
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=False,  # Don't decode as text - esptool may output binary data
-                timeout=60
-            )
+            result = self._run_esptool(args, timeout=60)
 
             if result.returncode != 0:
                 error_msg = "Binary generation failed\n"
@@ -164,6 +241,89 @@ class BinaryGenerator:
         except Exception as e:
             raise BinaryGeneratorError(f"Failed to generate binary: {e}") from e
 
+    def _elf2image_args(
+        self,
+        elf_path: Path,
+        output_bin: Path,
+        flash_mode: str,
+        elf_sha256_offset: Optional[str] = None
+    ) -> List[str]:
+        """Build esptool elf2image arguments for this chip and flash settings.
+
+        Args:
+            elf_path: Path to input ELF file
+            output_bin: Path for output image
+            flash_mode: Flash mode to embed in the image header
+            elf_sha256_offset: Optional offset for the app ELF SHA256 (e.g., "0xb0")
+
+        Returns:
+            List of esptool arguments
+        """
+        args = [
+            "--chip", self.mcu,
+            "elf2image",
+            "--flash-mode", flash_mode,
+            "--flash-freq", self.flash_freq,
+            "--flash-size", self.flash_size,
+        ]
+        if elf_sha256_offset is not None:
+            args += ["--elf-sha256-offset", elf_sha256_offset]
+        args += ["-o", str(output_bin), str(elf_path)]
+        return args
+
+    @staticmethod
+    def _run_esptool(args: List[str], timeout: int) -> subprocess.CompletedProcess:
+        """Run esptool with the given arguments.
+
+        esptool is a dependency of fbuild, so it is normally imported and run
+        in this interpreter, avoiding a new Python process (and re-importing
+        esptool and its dependencies) for every image. Falls back to
+        ``python -m esptool`` if it cannot be imported.
+
+        Args:
+            args: esptool command-line arguments (without the program name)
+            timeout: Timeout in seconds for the subprocess fallback
+
+        Returns:
+            CompletedProcess with returncode and captured stdout/stderr bytes
+        """
+        try:
+            import esptool
+        except ImportError:
+            return subprocess.run(
+                [sys.executable, "-m", "esptool", *args],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=False,  # Don't decode as text - esptool may output binary data
+                timeout=timeout
+            )
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        stdout_proxy = _get_captured_stream("stdout")
+        stderr_proxy = _get_captured_stream("stderr")
+        with _esptool_lock, stdout_proxy.capture(stdout), stderr_proxy.capture(stderr):
+            try:
+                esptool.main(args)
+                returncode = 0
+            except SystemExit as e:
+                returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+            except KeyboardInterrupt as ke:
+                from fbuild.interrupt_utils import handle_keyboard_interrupt_properly
+                handle_keyboard_interrupt_properly(ke)
+                raise  # Never reached, but satisfies type checker
+            except Exception as e:
+                # esptool reports failures such as FatalError by raising
+                print(f"esptool: {e}", file=sys.stderr)
+                returncode = 1
+
+        return subprocess.CompletedProcess(
+            args,
+            returncode,
+            stdout.getvalue().encode('utf-8'),
+            stderr.getvalue().encode('utf-8')
+        )
+
     def _generate_bin_objcopy(self, elf_path: Path, output_bin: Path) -> Path:
         """Generate firmware.bin using objcopy (for non-ESP32 platforms).
 
@@ -201,17 +361,19 @@ class BinaryGenerator:
             print("Generating firmware.bin...")
 
         try:
+            # Diagnostics go to stderr; discard stdout and keep stderr as raw
+            # bytes, only decoded when reporting a failure
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=30
             )
 
             if result.returncode != 0:
                 error_msg = "Binary generation failed\n"
-                error_msg += f"stderr: {result.stderr}\n"
-                error_msg += f"stdout: {result.stdout}"
+                error_msg += f"stderr: {result.stderr.decode('utf-8', errors='replace')}"
                 raise BinaryGeneratorError(error_msg)
 
             if not output_bin.exists():
@@ -244,7 +406,7 @@ class BinaryGenerator:
         Raises:
             BinaryGeneratorError: If generation fails
         """
-        if not self.mcu.startswith("esp32"):
+        if not self.is_esp32:
             raise BinaryGeneratorError(
                 f"Bootloader generation only supported for ESP32 platforms, not {self.mcu}"
             )
@@ -256,16 +418,8 @@ class BinaryGenerator:
         if output_bin is None:
             output_bin = self.build_dir / "bootloader.bin"
 
-        # Get flash parameters from board config
-        flash_mode = self.board_config.get("build", {}).get("flash_mode", "dio")
-        flash_freq = self.board_config.get("build", {}).get("f_flash", "80m")
-        flash_size = self.board_config.get("build", {}).get("flash_size", "4MB")
-
-        # Convert frequency to esptool format if needed
-        flash_freq = self._normalize_flash_freq(flash_freq)
-
         # Find bootloader ELF file in framework SDK
-        bootloader_name = f"bootloader_{flash_mode}_{flash_freq.replace('m', 'm')}.elf"
+        bootloader_name = f"bootloader_{self.flash_mode}_{self.flash_freq}.elf"
         sdk_bin_dir = self.framework.get_sdk_dir() / self.mcu / "bin"
         bootloader_elf = sdk_bin_dir / bootloader_name
 
@@ -279,39 +433,18 @@ class BinaryGenerator:
         # second-stage bootloader in DIO mode. QIO is enabled later by the second-stage
         # bootloader for the application. This is a known issue with esptool v4.7+.
         # See: https://github.com/espressif/arduino-esp32/discussions/10418
-        bootloader_flash_mode = flash_mode
-        if self.mcu in ["esp32c6", "esp32c3", "esp32c2", "esp32h2"]:
+        bootloader_flash_mode = self.flash_mode
+        if self.mcu in self.DIO_BOOTLOADER_MCUS:
             bootloader_flash_mode = "dio"
 
         # Generate bootloader.bin using esptool.py elf2image
-        cmd = [
-            sys.executable,
-            "-m",
-            "esptool",
-            "--chip",
-            self.mcu,
-            "elf2image",
-            "--flash-mode",
-            bootloader_flash_mode,
-            "--flash-freq",
-            flash_freq,
-            "--flash-size",
-            flash_size,
-            "-o",
-            str(output_bin),
-            str(bootloader_elf)
-        ]
+        args = self._elf2image_args(bootloader_elf, output_bin, bootloader_flash_mode)
 
         if self.show_progress:
             print("Generating bootloader.bin...")
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=False,
-                timeout=60
-            )
+            result = self._run_esptool(args, timeout=60)
 
             if result.returncode != 0:
                 error_msg = "Bootloader generation failed\n"
@@ -351,7 +484,7 @@ class BinaryGenerator:
         Raises:
             BinaryGeneratorError: If generation fails
         """
-        if not self.mcu.startswith("esp32"):
+        if not self.is_esp32:
             raise BinaryGeneratorError(
                 f"Partition table generation only supported for ESP32 platforms, not {self.mcu}"
             )
@@ -392,17 +525,19 @@ class BinaryGenerator:
             print("Generating partitions.bin...")
 
         try:
+            # Diagnostics go to stderr; discard stdout and keep stderr as raw
+            # bytes, only decoded when reporting a failure
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=30
             )
 
             if result.returncode != 0:
                 error_msg = "Partition table generation failed\n"
-                error_msg += f"stderr: {result.stderr}\n"
-                error_msg += f"stdout: {result.stdout}"
+                error_msg += f"stderr: {result.stderr.decode('utf-8', errors='replace')}"
                 raise BinaryGeneratorError(error_msg)
 
             if not output_bin.exists():
@@ -422,23 +557,3 @@ class BinaryGenerator:
             raise  # Never reached, but satisfies type checker
         except Exception as e:
             raise BinaryGeneratorError(f"Failed to generate partition table: {e}") from e
-
-    @staticmethod
-    def _normalize_flash_freq(flash_freq: Any) -> str:
-        """Normalize flash frequency to esptool format.
-
-        Args:
-            flash_freq: Flash frequency (int/float in Hz, or string like "80m" or "80000000L")
-
-        Returns:
-            Normalized frequency string (e.g., "80m")
-        """
-        if isinstance(flash_freq, (int, float)):
-            # Convert Hz to MHz format like "80m"
-            return f"{int(flash_freq // 1000000)}m"
-        elif isinstance(flash_freq, str) and flash_freq.endswith('L'):
-            # Handle string representation of long integers like "80000000L"
-            freq_value = int(flash_freq.rstrip('L'))
-            return f"{freq_value // 1000000}m"
-        else:
-            return str(flash_freq)
@@ -1,14 +1,17 @@
 """Build utilities for Fbuild.
 
 This module provides utility functions for build operations like
-printing size information and formatting build output.
+printing size information, formatting build output and writing tool
+response files.
 """
 
 import os
 import stat
 import shutil
+import threading
+import time
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, List, Optional
 
 from ..build.linker import SizeInfo
 
@@ -45,6 +48,22 @@ class SizeInfoPrinter:
             print()
 
 
+def quote_response_arg(arg: str) -> str:
+    """
+    Quote a single argument for a gcc/binutils response file.
+
+    gcc, ld and ar all expand @file arguments with the same libiberty
+    rules, so one quoting scheme covers every response file.
+
+    Args:
+        arg: Command line argument
+
+    Returns:
+        Argument in double quotes, with backslashes and quotes escaped
+    """
+    return '"' + arg.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
 def remove_readonly(func: Callable[[str], None], path: str, excinfo: Any) -> None:
     """
     Error handler for shutil.rmtree on Windows.
@@ -78,8 +97,6 @@ def safe_rmtree(path: Path, max_retries: int = 3) -> None:
     Raises:
         OSError: If directory cannot be removed after all retries
     """
-    import time
-
     if not path.exists():
         return
 
@@ -96,3 +113,75 @@ def safe_rmtree(path: Path, max_retries: int = 3) -> None:
                 raise OSError(
                     f"Failed to remove directory {path} after {max_retries} attempts: {e}"
                 ) from e
+
+
+def _remove_trees(paths: List[Path]) -> None:
+    """
+    Remove directory trees, ignoring failures (background cleanup only).
+
+    Args:
+        paths: Directories to remove
+    """
+    for path in paths:
+        try:
+            shutil.rmtree(path, onerror=remove_readonly)
+        except OSError:
+            pass
+
+
+def _is_abandoned_trash(trash: Path, prefix: str) -> bool:
+    """
+    Check whether a discarded tree was left behind by a process that exited.
+
+    Args:
+        trash: Hidden sibling created by discard_tree()
+        prefix: Name prefix of the discarded trees (".<name>.rm.")
+
+    Returns:
+        True if the process that discarded the tree is no longer running
+    """
+    try:
+        pid = int(trash.name[len(prefix):].split(".", 1)[0])
+    except ValueError:
+        return False
+    if pid == os.getpid():
+        # Still being removed by this process's own background thread
+        return False
+
+    import psutil
+
+    return not psutil.pid_exists(pid)
+
+
+def discard_tree(path: Path) -> None:
+    """
+    Move a directory tree out of the way and delete it in the background.
+
+    The directory is renamed to a hidden sibling, which is a single cheap
+    operation on the same filesystem, so a new directory can be created at
+    path immediately. Leftovers from discards whose process exited before
+    finishing are removed by the same background thread; trees that another
+    running process is still deleting are left to it. Falls back to
+    safe_rmtree() if the directory cannot be renamed (e.g., a file is locked
+    on Windows).
+
+    Args:
+        path: Path to directory to remove
+
+    Raises:
+        OSError: If the fallback removal fails
+    """
+    if not path.exists():
+        return
+
+    prefix = f".{path.name}.rm."
+    trash = path.with_name(f"{prefix}{os.getpid()}.{time.time_ns()}")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        safe_rmtree(path)
+        return
+
+    stale = [trash]
+    stale.extend(p for p in path.parent.iterdir() if p.name.startswith(prefix) and p != trash and _is_abandoned_trash(p, prefix))
+    threading.Thread(target=_remove_trees, args=(stale,), name=f"discard-{path.name}").start()
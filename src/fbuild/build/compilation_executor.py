@@ -8,15 +8,26 @@ Design:
     - Generates response files for include paths (avoids command line length limits)
     - Provides clear error messages for compilation failures
     - Supports both C and C++ compilation
-    - Integrates sccache for compilation caching
+    - Integrates sccache for compilation caching, falling back to ccache
+      (set CCACHE_DIR to share a ccache directory across a team, or
+      FBUILD_NO_COMPILER_CACHE=1 to compile without a cache wrapper)
     - Uses header trampoline cache to avoid Windows command-line length limits
+    - compile_source may be called from several threads at once
+    - Compiler processes are launched with close_fds=False so CPython can use
+      posix_spawn instead of fork/exec; Python's own file descriptors are
+      non-inheritable (PEP 446), so nothing leaks into the compiler
+    - hash_preprocessed keys objects by preprocessed source for the shared
+      object cache used when no compiler cache wrapper is available
 """
 
+import hashlib
+import os
 import subprocess
 import shutil
 import platform
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from ..packages.header_trampoline_cache import HeaderTrampolineCache
 
@@ -42,16 +53,31 @@ class CompilationExecutor:
         Args:
             build_dir: Build directory for response files
             show_progress: Whether to show compilation progress
-            use_sccache: Whether to use sccache for caching (default: True)
+            use_sccache: Whether to use sccache (or ccache) for caching (default: True)
             use_trampolines: Whether to use header trampolines on Windows (default: True)
         """
         self.build_dir = build_dir
         self.show_progress = show_progress
-        self.use_sccache = use_sccache
+        self.use_sccache = use_sccache and not os.environ.get("FBUILD_NO_COMPILER_CACHE")
         self.use_trampolines = use_trampolines
         self.sccache_path: Optional[Path] = None
+        self.ccache_path: Optional[Path] = None
         self.trampoline_cache: Optional[HeaderTrampolineCache] = None
 
+        # Directories already created by this executor, so the per-source
+        # mkdir calls on the compile path only hit the filesystem once
+        self._created_dirs: Set[Path] = set()
+
+        # Most recent command prefix and the (compiler, flags, includes) it
+        # was built from; see _get_command_prefix()
+        self._command_prefix: Optional[Tuple[str, ...]] = None
+        self._command_prefix_key: Optional[Tuple[Any, ...]] = None
+        self._command_prefix_lock = threading.Lock()
+
+        # Content of includes.rsp as last written, so an unchanged file is
+        # never rewritten while other compilers may be reading it
+        self._response_file_content: Optional[str] = None
+
         # Check if sccache is available
         if self.use_sccache:
             sccache_exe = shutil.which("sccache")
@@ -72,8 +98,22 @@ class CompilationExecutor:
                         print(f"[sccache] Enabled: {self.sccache_path}")
                         break
                 else:
-                    # Always warn if sccache not found
-                    print("[sccache] Warning: not found in PATH, proceeding without cache")
+                    ccache_exe = shutil.which("ccache")
+                    if ccache_exe:
+                        self.ccache_path = Path(ccache_exe)
+                        print(f"[ccache] Enabled: {self.ccache_path}")
+                    else:
+                        # Always warn if no compiler cache found
+                        print("[sccache] Warning: not found in PATH, proceeding without cache")
+
+        # ccache settings suited to freshly extracted toolchains and frameworks:
+        # compare compilers by content rather than mtime, and cache sources
+        # whose headers were just unpacked. User settings take precedence.
+        self._subprocess_env: Optional[Dict[str, str]] = None
+        if self.ccache_path is not None:
+            self._subprocess_env = dict(os.environ)
+            self._subprocess_env.setdefault("CCACHE_COMPILERCHECK", "content")
+            self._subprocess_env.setdefault("CCACHE_SLOPPINESS", "pch_defines,time_macros,include_file_mtime")
 
         # Initialize trampoline cache if enabled and on Windows
         if self.use_trampolines and platform.system() == 'Windows':
@@ -84,7 +124,7 @@ class CompilationExecutor:
         compiler_path: Path,
         source_path: Path,
         output_path: Path,
-        compile_flags: List[str],
+        compile_flags: Sequence[str],
         include_paths: List[Path]
     ) -> Path:
         """Compile a single source file.
@@ -111,8 +151,145 @@ class CompilationExecutor:
             raise CompilationError(f"Source file not found: {source_path}")
 
         # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_directory(output_path.parent)
+
+        cmd = list(self._get_command_prefix(compiler_path, compile_flags, include_paths))
+        # Emit a make-style dependency file listing the user headers this
+        # source includes, used for header-aware incremental rebuilds
+        cmd.extend(['-MMD', '-MF', str(self.get_dependency_file(output_path))])
+        cmd.extend(['-c', str(source_path)])
+        cmd.extend(['-o', str(output_path)])
+
+        # Execute compilation
+        if self.show_progress:
+            print(f"Compiling {source_path.name}...")
+
+        try:
+            # Capture raw bytes; output is only decoded when it is actually shown
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                env=self._subprocess_env,
+                close_fds=False,
+                timeout=60
+            )
+
+            if result.returncode != 0:
+                error_msg = f"Compilation failed for {source_path.name}\n"
+                error_msg += f"stderr: {result.stderr.decode('utf-8', errors='replace')}\n"
+                error_msg += f"stdout: {result.stdout.decode('utf-8', errors='replace')}"
+                raise CompilationError(error_msg)
+
+            if self.show_progress and result.stderr:
+                print(result.stderr.decode('utf-8', errors='replace'))
+
+            return output_path
+
+        except subprocess.TimeoutExpired as e:
+            raise CompilationError(f"Compilation timeout for {source_path.name}") from e
+        except KeyboardInterrupt as ke:
+            from fbuild.interrupt_utils import handle_keyboard_interrupt_properly
+            handle_keyboard_interrupt_properly(ke)
+            raise  # Never reached, but satisfies type checker
+        except Exception as e:
+            if isinstance(e, CompilationError):
+                raise
+            raise CompilationError(f"Failed to compile {source_path.name}: {e}") from e
+
+    @property
+    def has_compiler_cache(self) -> bool:
+        """Whether compiles go through an sccache or ccache wrapper."""
+        return self.sccache_path is not None or self.ccache_path is not None
+
+    def hash_preprocessed(
+        self,
+        compiler_path: Path,
+        source_path: Path,
+        compile_flags: Sequence[str],
+        include_paths: List[Path]
+    ) -> Optional[str]:
+        """Hash the preprocessed source together with the compiler and flags.
+
+        The hash identifies the object the source compiles to, independent of
+        the build directory, so identical objects can be shared between
+        environments.
+
+        Args:
+            compiler_path: Path to compiler executable (gcc/g++)
+            source_path: Path to source file
+            compile_flags: Compilation flags
+            include_paths: Include directory paths
+
+        Returns:
+            Hex digest, or None if the source could not be preprocessed (the
+            compile itself then reports the error)
+        """
+        cmd = list(self._get_command_prefix(compiler_path, compile_flags, include_paths))
+        cmd.extend(['-E', str(source_path)])
+        try:
+            result = subprocess.run(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                env=self._subprocess_env,
+                close_fds=False,
+                timeout=60
+            )
+        except subprocess.TimeoutExpired:
+            return None
+        if result.returncode != 0:
+            return None
+
+        digest = hashlib.sha256()
+        digest.update('\0'.join((str(compiler_path), *compile_flags)).encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(result.stdout)
+        return digest.hexdigest()
+
+    def _get_command_prefix(
+        self,
+        compiler_path: Path,
+        compile_flags: Sequence[str],
+        include_paths: List[Path]
+    ) -> Tuple[str, ...]:
+        """Get the compiler command up to and including the response file.
+
+        The prefix (cache wrapper, compiler, flags and @includes.rsp) only
+        changes when the compiler, flags or include paths change, so the most
+        recent one is reused and the response file is only rewritten when the
+        include paths differ from the previous source.
+
+        Args:
+            compiler_path: Path to compiler executable (gcc/g++)
+            compile_flags: Compilation flags
+            include_paths: Include directory paths
+
+        Returns:
+            Immutable command prefix
+        """
+        key = (compiler_path, tuple(compile_flags), tuple(include_paths))
+        with self._command_prefix_lock:
+            if self._command_prefix is None or key != self._command_prefix_key:
+                self._command_prefix = self._build_command_prefix(compiler_path, compile_flags, include_paths)
+                self._command_prefix_key = key
+            return self._command_prefix
+
+    def _build_command_prefix(
+        self,
+        compiler_path: Path,
+        compile_flags: Sequence[str],
+        include_paths: List[Path]
+    ) -> Tuple[str, ...]:
+        """Build the compiler command prefix and write its response file.
+
+        Args:
+            compiler_path: Path to compiler executable (gcc/g++)
+            compile_flags: Compilation flags
+            include_paths: Include directory paths
 
+        Returns:
+            Immutable command prefix
+        """
         # Apply header trampoline cache on Windows when enabled
         # This resolves Windows CreateProcess 32K limit issues with sccache
         effective_include_paths = include_paths
@@ -139,14 +316,14 @@ class CompilationExecutor:
 
         # Convert include paths to flags - ensure no quotes for sccache compatibility
         # GCC response files with quotes cause sccache to treat @file literally
-        include_flags = [f"-I{str(inc).replace(chr(92), '/')}" for inc in effective_include_paths]
+        include_flags = [f"-I{inc.as_posix()}" for inc in effective_include_paths]
         response_file = self._write_response_file(include_flags)
 
-        # Build compiler command with optional sccache wrapper
+        # Build compiler command with optional sccache/ccache wrapper
         # With trampolines enabled, we can now use sccache even with many includes
         use_sccache = self.sccache_path is not None
 
-        cmd = []
+        cmd: List[str] = []
         if use_sccache:
             cmd.append(str(self.sccache_path))
             # Use absolute resolved path for sccache
@@ -157,46 +334,65 @@ class CompilationExecutor:
             if platform.system() == 'Windows':
                 compiler_str = compiler_str.replace('/', '\\')
             cmd.append(compiler_str)
+        elif self.ccache_path is not None:
+            cmd.append(str(self.ccache_path))
+            cmd.append(str(compiler_path))
         else:
             cmd.append(str(compiler_path))
         cmd.extend(compile_flags)
         cmd.append(f"@{response_file}")
-        cmd.extend(['-c', str(source_path)])
-        cmd.extend(['-o', str(output_path)])
+        return tuple(cmd)
 
-        # Execute compilation
-        if self.show_progress:
-            print(f"Compiling {source_path.name}...")
+    def _ensure_directory(self, directory: Path) -> None:
+        """Create a directory once per executor.
 
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+        Args:
+            directory: Directory to create (including parents)
+        """
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
 
-            if result.returncode != 0:
-                error_msg = f"Compilation failed for {source_path.name}\n"
-                error_msg += f"stderr: {result.stderr}\n"
-                error_msg += f"stdout: {result.stdout}"
-                raise CompilationError(error_msg)
+    @staticmethod
+    def get_dependency_file(output_path: Path) -> Path:
+        """Get the dependency file path written alongside an object file.
 
-            if self.show_progress and result.stderr:
-                print(result.stderr)
+        Args:
+            output_path: Path of the object file
 
-            return output_path
+        Returns:
+            Path to the .d file (e.g., foo.o -> foo.o.d)
+        """
+        return output_path.with_name(f"{output_path.name}.d")
 
-        except subprocess.TimeoutExpired as e:
-            raise CompilationError(f"Compilation timeout for {source_path.name}") from e
-        except KeyboardInterrupt as ke:
-            from fbuild.interrupt_utils import handle_keyboard_interrupt_properly
-            handle_keyboard_interrupt_properly(ke)
-            raise  # Never reached, but satisfies type checker
-        except Exception as e:
-            if isinstance(e, CompilationError):
-                raise
-            raise CompilationError(f"Failed to compile {source_path.name}: {e}") from e
+    @staticmethod
+    def read_dependencies(dep_file: Path) -> List[Path]:
+        """Read the prerequisites from a gcc -MMD dependency file.
+
+        Args:
+            dep_file: Path to .d file
+
+        Returns:
+            List of files the object depends on (source and headers)
+
+        Raises:
+            OSError: If the dependency file cannot be read
+        """
+        content = dep_file.read_text(encoding='utf-8', errors='replace')
+
+        # Join continuation lines, then drop the "target:" part. The target
+        # separator is a colon followed by whitespace, which skips Windows
+        # drive letters such as "C:/..."
+        content = content.replace('\\\r\n', ' ').replace('\\\n', ' ')
+        _, sep, prerequisites = content.partition(': ')
+        if not sep:
+            return []
+
+        # Split on whitespace, honoring backslash-escaped spaces in paths
+        deps = []
+        for token in prerequisites.replace('\\ ', '\0').split():
+            deps.append(Path(token.replace('\0', ' ')))
+        return deps
 
     def _write_response_file(self, include_flags: List[str]) -> Path:
         """Write include paths to response file.
@@ -211,10 +407,18 @@ class CompilationExecutor:
             Path to generated response file
         """
         response_file = self.build_dir / "includes.rsp"
-        response_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(response_file, 'w') as f:
-            f.write('\n'.join(include_flags))
+        content = '\n'.join(include_flags)
+        if content == self._response_file_content:
+            return response_file
+
+        # Write under a temporary name and rename, so compilers running in
+        # parallel never read a partially written file
+        self._ensure_directory(response_file.parent)
+        tmp_file = response_file.with_name(f"{response_file.name}.tmp")
+        with open(tmp_file, 'w') as f:
+            f.write(content)
+        os.replace(tmp_file, response_file)
+        self._response_file_content = content
 
         return response_file
 
@@ -240,34 +444,30 @@ class CompilationExecutor:
         if not ino_path.exists():
             raise CompilationError(f"Sketch file not found: {ino_path}")
 
-        # Read .ino content
-        try:
-            with open(ino_path, 'r', encoding='utf-8') as f:
-                ino_content = f.read()
-        except KeyboardInterrupt as ke:
-            from fbuild.interrupt_utils import handle_keyboard_interrupt_properly
-            handle_keyboard_interrupt_properly(ke)
-            raise  # Never reached, but satisfies type checker
-        except Exception as e:
-            raise CompilationError(f"Failed to read {ino_path}: {e}") from e
-
         # Generate .cpp file path
         cpp_path = output_dir / "sketch" / f"{ino_path.stem}.ino.cpp"
-        cpp_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Simple preprocessing: add Arduino.h and content
-        cpp_content = '#include <Arduino.h>\n\n' + ino_content
+        # Skip regeneration when the .cpp is already up to date, so its mtime
+        # doesn't change and force a needless recompile of the sketch
+        if cpp_path.exists() and cpp_path.stat().st_mtime_ns > ino_path.stat().st_mtime_ns:
+            return cpp_path
+
+        self._ensure_directory(cpp_path.parent)
 
-        # Write .cpp file
+        # Simple preprocessing: write the Arduino.h include, then stream the
+        # .ino bytes straight into the .cpp without decoding the whole sketch
         try:
-            with open(cpp_path, 'w', encoding='utf-8') as f:
-                f.write(cpp_content)
+            with open(ino_path, 'rb') as src, open(cpp_path, 'wb') as out:
+                out.write(b'#include <Arduino.h>\n\n')
+                shutil.copyfileobj(src, out, 65536)
         except KeyboardInterrupt as ke:
             from fbuild.interrupt_utils import handle_keyboard_interrupt_properly
             handle_keyboard_interrupt_properly(ke)
             raise  # Never reached, but satisfies type checker
         except Exception as e:
-            raise CompilationError(f"Failed to write {cpp_path}: {e}") from e
+            # Don't leave a partial .cpp behind that looks newer than the .ino
+            cpp_path.unlink(missing_ok=True)
+            raise CompilationError(f"Failed to preprocess {ino_path} -> {cpp_path}: {e}") from e
 
         if self.show_progress:
             print(f"Preprocessed {ino_path.name} -> {cpp_path.name}")
@@ -7,18 +7,83 @@ Design:
     - Loads compilation flags, includes, and settings from JSON/Python config
     - Generic implementation replaces platform-specific compiler classes
     - Same interface as ESP32Compiler for drop-in replacement
+    - Core objects are named by source stem plus a hash of the source path and
+      flags, so same-stem sources never collide and flag changes rebuild
+    - Core sources are compiled in parallel, one compiler process per CPU
+    - The core archive key hashes every input of the core build, so a finished
+      core archive can be reused by any build with the same inputs
+    - Without a compiler cache wrapper, core objects are shared between
+      environments through a content-addressed object cache keyed by the
+      preprocessed source and hardlinked into each build directory; the cache
+      keeps only the most recently used objects
 """
 
-import json
+import hashlib
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, List, Dict, Optional, Union
+from typing import Any, List, Dict, Mapping, Optional, Tuple, Union
 
 from ..packages.package import IPackage, IToolchain, IFramework
 from .flag_builder import FlagBuilder
 from .compilation_executor import CompilationExecutor
 from .archive_creator import ArchiveCreator
+from .platform_config_loader import get_default_config_path, load_platform_config
 from .compiler import ICompiler, CompilerError
 
+# Compiler processes run at once when compiling core sources
+_COMPILE_WORKERS = os.cpu_count() or 1
+
+# Objects kept in the shared object cache; the least recently used are
+# pruned beyond this (a core build adds a few hundred)
+_OBJECT_CACHE_MAX_ENTRIES = 4096
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, copying instead when hardlinks are unsupported.
+
+    Args:
+        src: Existing file
+        dst: New path (must not exist)
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _prune_object_cache(cache_dir: Path) -> None:
+    """Remove the least recently used objects beyond the object cache cap.
+
+    A cache hit hardlinks the cached object and touches it, so an object's
+    modification time is its last use. Objects already linked into a build
+    directory stay valid after their cache entry is removed.
+
+    Args:
+        cache_dir: Object cache directory
+    """
+    entries = []
+    try:
+        with os.scandir(cache_dir) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as it:
+                    entries.extend((e.stat().st_mtime_ns, e.path) for e in it if e.name.endswith(".o"))
+    except OSError:
+        return
+    if len(entries) <= _OBJECT_CACHE_MAX_ENTRIES:
+        return
+    entries.sort(reverse=True)
+    for _, path in entries[_OBJECT_CACHE_MAX_ENTRIES:]:
+        for stale in (path, f"{path[:-2]}.d"):
+            try:
+                os.unlink(stale)
+            except OSError:
+                pass
+
 
 class ConfigurableCompilerError(CompilerError):
     """Raised when configurable compilation operations fail."""
@@ -42,9 +107,12 @@ class ConfigurableCompiler(ICompiler):
         framework: IFramework,
         board_id: str,
         build_dir: Path,
-        platform_config: Optional[Union[Dict, Path]] = None,
+        platform_config: Optional[Union[Mapping, Path]] = None,
         show_progress: bool = True,
-        user_build_flags: Optional[List[str]] = None
+        user_build_flags: Optional[List[str]] = None,
+        object_cache_dir: Optional[Path] = None,
+        lto: bool = False,
+        project_dir: Optional[Path] = None
     ):
         """Initialize configurable compiler.
 
@@ -57,6 +125,11 @@ class ConfigurableCompiler(ICompiler):
             platform_config: Platform config dict or path to config JSON file
             show_progress: Whether to show compilation progress
             user_build_flags: Build flags from platformio.ini
+            object_cache_dir: Shared content-addressed cache directory for core
+                objects, used when no sccache/ccache wrapper is available
+            lto: Whether to compile for link-time optimization
+            project_dir: Project directory that relative include paths in
+                the user build flags are resolved against
         """
         self.platform = platform
         self.toolchain = toolchain
@@ -78,24 +151,28 @@ class ConfigurableCompiler(ICompiler):
         # Get core name from board config (defaults to "arduino" if not specified)
         self.core = self.board_config.get("build", {}).get("core", "arduino")
 
+        # Resolve toolchain binaries once; each lookup rescans the toolchain
+        # bin directory, which is too costly to repeat for every source file
+        self._gcc_path: Optional[Path] = toolchain.get_gcc_path()
+        self._gxx_path: Optional[Path] = toolchain.get_gxx_path()
+        self._ar_path: Optional[Path] = toolchain.get_ar_path()
+
         # Load platform configuration
         if platform_config is None:
             # Try to load from default location
-            config_path = Path(__file__).parent.parent / "platform_configs" / f"{self.mcu}.json"
+            config_path = get_default_config_path(self.mcu)
             if config_path.exists():
-                with open(config_path, 'r') as f:
-                    self.config = json.load(f)
+                self.config = load_platform_config(config_path)
             else:
                 raise ConfigurableCompilerError(
                     f"No platform configuration found for {self.mcu}. " +
                     f"Expected: {config_path}"
                 )
-        elif isinstance(platform_config, dict):
+        elif isinstance(platform_config, Mapping):
             self.config = platform_config
         else:
             # Assume it's a path
-            with open(platform_config, 'r') as f:
-                self.config = json.load(f)
+            self.config = load_platform_config(platform_config)
 
         # Initialize utility components
         self.flag_builder = FlagBuilder(
@@ -103,7 +180,9 @@ class ConfigurableCompiler(ICompiler):
             board_config=self.board_config,
             board_id=self.board_id,
             variant=self.variant,
-            user_build_flags=self.user_build_flags
+            user_build_flags=self.user_build_flags,
+            lto=lto,
+            project_dir=project_dir
         )
         self.compilation_executor = CompilationExecutor(
             build_dir=self.build_dir,
@@ -111,16 +190,73 @@ class ConfigurableCompiler(ICompiler):
         )
         self.archive_creator = ArchiveCreator(show_progress=self.show_progress)
 
+        # A compiler cache wrapper already shares objects between builds
+        self.object_cache_dir: Optional[Path] = (
+            None if self.compilation_executor.has_compiler_cache else object_cache_dir
+        )
+
+        # Set when an object is added to the object cache, so the cache is
+        # only pruned after builds that grew it
+        self._object_cache_grew = False
+
         # Cache for include paths
         self._include_paths_cache: Optional[List[Path]] = None
 
+        # Frozen per-language flags (common + C or C++ flags), keyed by is_cpp.
+        # Shared by every compile_source() call instead of copied per file
+        self._language_flags_cache: Dict[bool, Tuple[str, ...]] = {}
+
+        # Library include paths staged by add_library_includes(), merged into
+        # the include path cache on the next get_include_paths() call
+        self._pending_lib_includes: List[Path] = []
+
+        # Core source list, scanned once from the framework
+        self._core_sources: Optional[List[Path]] = None
+
     def get_compile_flags(self) -> Dict[str, List[str]]:
         """Get compilation flags from configuration.
 
         Returns:
             Dictionary with 'cflags', 'cxxflags', and 'common' keys
         """
-        return self.flag_builder.build_flags()
+        return {k: list(v) for k, v in self.flag_builder.build_flags().items()}
+
+    def _get_language_flags(self, is_cpp: bool) -> Tuple[str, ...]:
+        """Get the combined compile flags for C or C++ sources.
+
+        Args:
+            is_cpp: True for C++ sources, False for C sources
+
+        Returns:
+            Immutable tuple of common flags followed by language flags
+        """
+        language_flags = self._language_flags_cache.get(is_cpp)
+        if language_flags is None:
+            flags = self.flag_builder.build_flags()
+            language_flags = (*flags['common'], *flags['cxxflags' if is_cpp else 'cflags'])
+            self._language_flags_cache[is_cpp] = language_flags
+        return language_flags
+
+    def get_object_path(self, source_path: Path, obj_dir: Path) -> Path:
+        """Get the deterministic object file path for a source.
+
+        The name combines the source stem with a hash of the full source path
+        and its compile flags (e.g., obj/core/Print-1a2b3c4d5e6f7a8b.o), so
+        sources sharing a stem get distinct objects and changing the flags
+        produces a fresh object instead of reusing a stale one.
+
+        Args:
+            source_path: Path to .c or .cpp source file
+            obj_dir: Directory the object file is placed in
+
+        Returns:
+            Path to the .o file for this source
+        """
+        is_cpp = source_path.suffix in ['.cpp', '.cxx', '.cc']
+        key = hashlib.sha1(
+            '\0'.join((str(source_path), *self._get_language_flags(is_cpp))).encode('utf-8')
+        ).hexdigest()[:16]
+        return obj_dir / f"{source_path.stem}-{key}.o"
 
     def get_include_paths(self) -> List[Path]:
         """Get all include paths needed for compilation.
@@ -129,6 +265,9 @@ class ConfigurableCompiler(ICompiler):
             List of include directory paths
         """
         if self._include_paths_cache is not None:
+            if self._pending_lib_includes:
+                self._include_paths_cache.extend(self._pending_lib_includes)
+                self._pending_lib_includes = []
             return self._include_paths_cache
 
         includes = []
@@ -168,6 +307,10 @@ class ConfigurableCompiler(ICompiler):
             if flash_config_dir.exists():
                 includes.append(flash_config_dir)
 
+        # Library includes registered before the first lookup
+        includes.extend(self._pending_lib_includes)
+        self._pending_lib_includes = []
+
         self._include_paths_cache = includes
         return includes
 
@@ -206,12 +349,38 @@ class ConfigurableCompiler(ICompiler):
         Returns:
             Path to generated .o file
 
+        Raises:
+            ConfigurableCompilerError: If compilation fails
+        """
+        return self._compile_source(source_path, output_path, use_object_cache=False)
+
+    def _compile_source(
+        self,
+        source_path: Path,
+        output_path: Optional[Path],
+        use_object_cache: bool
+    ) -> Path:
+        """Compile a single source file, optionally through the object cache.
+
+        Only framework-owned sources are worth sharing; a project source is
+        only ever built by its own environment, so hashing its preprocessed
+        output would just cost an extra preprocessor run and a cache entry.
+
+        Args:
+            source_path: Path to .c or .cpp source file
+            output_path: Optional path for output .o file
+            use_object_cache: Whether to share the object through the object
+                cache (when one is configured)
+
+        Returns:
+            Path to generated .o file
+
         Raises:
             ConfigurableCompilerError: If compilation fails
         """
         # Determine compiler based on file extension
         is_cpp = source_path.suffix in ['.cpp', '.cxx', '.cc']
-        compiler_path = self.toolchain.get_gxx_path() if is_cpp else self.toolchain.get_gcc_path()
+        compiler_path = self._gxx_path if is_cpp else self._gcc_path
 
         if compiler_path is None:
             raise ConfigurableCompilerError(
@@ -220,23 +389,24 @@ class ConfigurableCompiler(ICompiler):
 
         # Generate output path if not provided
         if output_path is None:
-            obj_dir = self.build_dir / "obj"
-            obj_dir.mkdir(parents=True, exist_ok=True)
-            output_path = obj_dir / f"{source_path.stem}.o"
+            output_path = self.get_object_path(source_path, self.build_dir / "obj")
+
+        # Reuse the existing object when neither the source nor its headers changed
+        if not self.needs_rebuild(source_path, output_path):
+            return output_path
 
         # Get compilation flags
-        flags = self.get_compile_flags()
-        compile_flags = flags['common'].copy()
-        if is_cpp:
-            compile_flags.extend(flags['cxxflags'])
-        else:
-            compile_flags.extend(flags['cflags'])
+        compile_flags = self._get_language_flags(is_cpp)
 
         # Get include paths
         includes = self.get_include_paths()
 
         # Compile using executor
         try:
+            if use_object_cache and self.object_cache_dir is not None:
+                return self._compile_through_object_cache(
+                    compiler_path, source_path, output_path, compile_flags, includes
+                )
             return self.compilation_executor.compile_source(
                 compiler_path=compiler_path,
                 source_path=source_path,
@@ -251,6 +421,81 @@ class ConfigurableCompiler(ICompiler):
         except Exception as e:
             raise ConfigurableCompilerError(str(e))
 
+    def _compile_through_object_cache(
+        self,
+        compiler_path: Path,
+        source_path: Path,
+        output_path: Path,
+        compile_flags: Tuple[str, ...],
+        includes: List[Path]
+    ) -> Path:
+        """Compile a source, reusing an identical object from the object cache.
+
+        Objects are keyed by a hash of the preprocessed source and flags. A hit
+        hardlinks the cached object (and copies its dependency file) into the
+        build directory; a miss compiles as usual and adds the object to the
+        cache under a temporary name moved into place with os.replace.
+
+        Args:
+            compiler_path: Path to compiler executable (gcc/g++)
+            source_path: Path to source file
+            output_path: Path for output object file
+            compile_flags: Compilation flags
+            includes: Include directory paths
+
+        Returns:
+            Path to the object file
+
+        Raises:
+            CompilationError: If compilation fails
+        """
+        assert self.object_cache_dir is not None
+        executor = self.compilation_executor
+        key = executor.hash_preprocessed(compiler_path, source_path, compile_flags, includes)
+
+        # The object may be a hardlink into the cache; never write through it
+        output_path.unlink(missing_ok=True)
+        dep_file = executor.get_dependency_file(output_path)
+
+        if key is not None:
+            cached = self.object_cache_dir / key[:2] / f"{key}.o"
+            cached_dep = executor.get_dependency_file(cached)
+            if cached.exists():
+                try:
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+                    _link_or_copy(cached, output_path)
+                    shutil.copyfile(cached_dep, dep_file)
+                    # Mark the object as newer than its sources for needs_rebuild()
+                    os.utime(output_path)
+                    return output_path
+                except OSError:
+                    # Incomplete or concurrently evicted entry: compile instead
+                    output_path.unlink(missing_ok=True)
+
+        executor.compile_source(
+            compiler_path=compiler_path,
+            source_path=source_path,
+            output_path=output_path,
+            compile_flags=compile_flags,
+            include_paths=includes
+        )
+
+        if key is not None:
+            # Store the dependency file first, so a cached object always has one
+            tmp_object = cached.with_name(f"{cached.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                cached.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(dep_file, cached_dep)
+                _link_or_copy(output_path, tmp_object)
+                os.replace(tmp_object, cached)
+                self._object_cache_grew = True
+            except OSError as e:
+                tmp_object.unlink(missing_ok=True)
+                if self.show_progress:
+                    print(f"Warning: Could not cache {output_path.name}: {e}")
+
+        return output_path
+
     def compile_sketch(self, sketch_path: Path) -> List[Path]:
         """Compile an Arduino sketch.
 
@@ -274,6 +519,44 @@ class ConfigurableCompiler(ICompiler):
 
         return object_files
 
+    def _get_core_sources(self) -> List[Path]:
+        """Get the Arduino core source files, scanning the framework once.
+
+        Returns:
+            List of core source file paths
+        """
+        if self._core_sources is None:
+            core_sources: List[Path] = self.framework.get_core_sources(self.core)  # type: ignore[attr-defined]
+            self._core_sources = core_sources
+            return core_sources
+        return self._core_sources
+
+    def get_core_archive_key(self) -> str:
+        """Get a content key identifying the core archive for the current inputs.
+
+        The key covers the compiler binaries (whose paths carry the toolchain
+        version), the per-language flags, the core include paths, and the path,
+        size and modification time of every core source. It must be computed
+        before library includes are added.
+
+        Returns:
+            Hex digest identifying the core archive
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        parts = [
+            self.board_id,
+            str(self._gcc_path),
+            str(self._gxx_path),
+            *self._get_language_flags(False),
+            *self._get_language_flags(True),
+            *map(str, self.get_include_paths()),
+        ]
+        for source in self._get_core_sources():
+            st = source.stat()
+            parts.append(f"{source}:{st.st_size}:{st.st_mtime_ns}")
+        digest.update('\0'.join(parts).encode('utf-8'))
+        return digest.hexdigest()
+
     def compile_core(self) -> List[Path]:
         """Compile Arduino core sources.
 
@@ -286,24 +569,40 @@ class ConfigurableCompiler(ICompiler):
         object_files = []
 
         # Get core sources
-        core_sources = self.framework.get_core_sources(self.core)  # type: ignore[attr-defined]
+        core_sources = self._get_core_sources()
 
         if self.show_progress:
             print(f"Compiling {len(core_sources)} core source files...")
 
-        # Create core object directory
+        # Core object directory (created by the executor on first compile)
         core_obj_dir = self.build_dir / "obj" / "core"
-        core_obj_dir.mkdir(parents=True, exist_ok=True)
 
-        # Compile each core source
-        for source in core_sources:
-            try:
-                obj_path = core_obj_dir / f"{source.stem}.o"
-                compiled_obj = self.compile_source(source, obj_path)
-                object_files.append(compiled_obj)
-            except ConfigurableCompilerError as e:
-                if self.show_progress:
-                    print(f"Warning: Failed to compile {source.name}: {e}")
+        # Resolve shared state before compiling from several threads
+        self.get_include_paths()
+        self._get_language_flags(True)
+        self._get_language_flags(False)
+
+        # Compile core sources in parallel; each worker just waits on its
+        # compiler process, and results are collected in source order
+        pool = ThreadPoolExecutor(max_workers=_COMPILE_WORKERS)
+        try:
+            futures = [
+                pool.submit(self._compile_source, source, self.get_object_path(source, core_obj_dir), True)
+                for source in core_sources
+            ]
+            for source, future in zip(core_sources, futures):
+                try:
+                    object_files.append(future.result())
+                except ConfigurableCompilerError as e:
+                    if self.show_progress:
+                        print(f"Warning: Failed to compile {source.name}: {e}")
+        finally:
+            # On interrupt, drop sources that have not started compiling
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        if self._object_cache_grew and self.object_cache_dir is not None:
+            self._object_cache_grew = False
+            _prune_object_cache(self.object_cache_dir)
 
         return object_files
 
@@ -320,7 +619,7 @@ class ConfigurableCompiler(ICompiler):
             ConfigurableCompilerError: If archive creation fails
         """
         # Get archiver tool
-        ar_path = self.toolchain.get_ar_path()
+        ar_path = self._ar_path
 
         if ar_path is None:
             raise ConfigurableCompilerError("Archiver (ar) path not found")
@@ -339,6 +638,35 @@ class ConfigurableCompiler(ICompiler):
         except Exception as e:
             raise ConfigurableCompilerError(str(e))
 
+    def export_core_archive(self, object_files: List[Path], archive_path: Path) -> Path:
+        """Create a self-contained copy of the core archive at archive_path.
+
+        Unlike core.a, which is a thin archive referencing objects in the build
+        directory, the exported archive embeds the objects so it stays valid
+        after the build directory is cleaned.
+
+        Args:
+            object_files: List of core object file paths to archive
+            archive_path: Path for the output .a file
+
+        Returns:
+            Path to the generated archive
+
+        Raises:
+            ConfigurableCompilerError: If archive creation fails
+        """
+        if self._ar_path is None:
+            raise ConfigurableCompilerError("Archiver (ar) path not found")
+
+        try:
+            return self.archive_creator.create_archive(self._ar_path, archive_path, object_files)
+        except KeyboardInterrupt as ke:
+            from fbuild.interrupt_utils import handle_keyboard_interrupt_properly
+            handle_keyboard_interrupt_properly(ke)
+            raise  # Never reached, but satisfies type checker
+        except Exception as e:
+            raise ConfigurableCompilerError(str(e))
+
     def get_compiler_info(self) -> Dict[str, Any]:
         """Get information about the compiler configuration.
 
@@ -351,8 +679,8 @@ class ConfigurableCompiler(ICompiler):
             'variant': self.variant,
             'build_dir': str(self.build_dir),
             'toolchain_type': self.toolchain.toolchain_type,  # type: ignore[attr-defined]
-            'gcc_path': str(self.toolchain.get_gcc_path()),
-            'gxx_path': str(self.toolchain.get_gxx_path()),
+            'gcc_path': str(self._gcc_path),
+            'gxx_path': str(self._gxx_path),
         }
 
         # Add compile flags
@@ -377,11 +705,14 @@ class ConfigurableCompiler(ICompiler):
     def add_library_includes(self, library_includes: List[Path]) -> None:
         """Add library include paths to the compiler.
 
+        The paths are staged and merged into the include path list the next
+        time it is requested, so adding libraries one at a time stays cheap
+        and paths added before the first lookup are not lost.
+
         Args:
             library_includes: List of library include directory paths
         """
-        if self._include_paths_cache is not None:
-            self._include_paths_cache.extend(library_includes)
+        self._pending_lib_includes.extend(library_includes)
 
     def needs_rebuild(self, source: Path, object_file: Path) -> bool:
         """Check if source file needs to be recompiled.
@@ -391,7 +722,8 @@ class ConfigurableCompiler(ICompiler):
             object_file: Object file path
 
         Returns:
-            True if source is newer than object file or object doesn't exist
+            True if the object doesn't exist, has no dependency file, or the
+            source or any header it includes is newer than the object
         """
         if not object_file.exists():
             return True
@@ -399,7 +731,21 @@ class ConfigurableCompiler(ICompiler):
         source_mtime = source.stat().st_mtime
         object_mtime = object_file.stat().st_mtime
 
-        return source_mtime > object_mtime
+        if source_mtime > object_mtime:
+            return True
+
+        # Check the headers recorded by the compiler's -MMD dependency file
+        dep_file = CompilationExecutor.get_dependency_file(object_file)
+        try:
+            dependencies = CompilationExecutor.read_dependencies(dep_file)
+            for dependency in dependencies:
+                if dependency.stat().st_mtime > object_mtime:
+                    return True
+        except OSError:
+            # Missing dependency file or a removed header
+            return True
+
+        return False
 
     def compile(
         self,
@@ -7,17 +7,159 @@ Design:
     - Loads linker flags, scripts, libraries from JSON/Python config
     - Generic implementation replaces platform-specific linker classes
     - Same interface as ESP32Linker for drop-in replacement
+    - Skips linking when the command and every input's size and mtime match
+      the previous link of the same output
+    - Reuses earlier link results (.zapio_link_cache next to the build
+      directory, so it survives clean builds) keyed by a hash of the linker
+      command and the contents of every input file; the least recently used
+      entries beyond a small cap are pruned
+    - Thin archives (core.a) only record member paths, so their member
+      objects are fingerprinted and hashed along with the archive
+    - Input digests are memoized per process by path, size and mtime, so the
+      cache key only re-reads inputs that changed since the last link
 """
 
-import json
+import hashlib
+import os
+import shutil
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Mapping, Optional, Tuple, Union
 
 from ..packages.package import IPackage, IToolchain, IFramework
 from .binary_generator import BinaryGenerator
+from .build_utils import quote_response_arg
+from .flag_builder import LTO_LINK_FLAGS
+from .platform_config_loader import get_default_config_path, load_platform_config
 from .compiler import ILinker, LinkerError
 
+# Standard libraries linked inside the library group on every link
+_STANDARD_LIBS = ("-lgcc", "-lstdc++", "-lm", "-lc")
+
+# Minimum linker timeout in seconds, extra seconds allowed per link input
+# (large ESP32 links can legitimately exceed the minimum) and number of
+# trailing diagnostic lines kept for error reports
+_LINK_TIMEOUT = 120
+_LINK_TIMEOUT_PER_INPUT = 0.1
+_LINK_OUTPUT_TAIL_LINES = 500
+
+# Link inputs up to this size are hashed from a single read
+_HASH_SMALL_FILE_SIZE = 1024 * 1024
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Threads used to hash link inputs (hashlib releases the GIL on large
+# buffers, so archives are hashed in parallel)
+_HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+# Cached link results kept before the least recently used are pruned
+_LINK_CACHE_MAX_ENTRIES = 8
+
+# Signature at the start of a GNU thin archive
+_THIN_ARCHIVE_MAGIC = b"!<thin>\n"
+
+# SDK linker scripts and libraries discovered by any linker in this process
+# (the daemon runs many builds), keyed by everything the result depends on
+_shared_linker_scripts: Dict[Tuple[Any, ...], Tuple[Path, ...]] = {}
+_shared_sdk_libs: Dict[Tuple[Any, ...], Tuple[Path, ...]] = {}
+
+# Content digests of link inputs hashed by any linker in this process, keyed
+# by path and holding the size and modification time they were taken at. SDK
+# archives and linker scripts never change within a process, so only the
+# objects rebuilt since the last link are read again
+_shared_file_digests: Dict[Path, Tuple[int, int, bytes]] = {}
+
+
+def _hash_file(path: Path) -> bytes:
+    """Hash the contents of a link input file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Digest of the file contents
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= _HASH_SMALL_FILE_SIZE:
+            return hashlib.blake2b(f.read(), digest_size=16).digest()
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: reads into a reusable buffer without extra copies
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).digest()
+        h = hashlib.blake2b(digest_size=16)
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+        return h.digest()
+
+
+def _hash_file_cached(path: Path) -> bytes:
+    """Hash a link input file, reusing the digest while it is unchanged.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Digest of the file contents
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    st = os.stat(path)
+    cached = _shared_file_digests.get(path)
+    if cached is not None and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+        return cached[2]
+    digest = _hash_file(path)
+    _shared_file_digests[path] = (st.st_size, st.st_mtime_ns, digest)
+    return digest
+
+
+def _thin_archive_members(archive: Path) -> List[Path]:
+    """List the member files referenced by a GNU thin archive.
+
+    A thin archive stores member paths (relative to the archive) instead of
+    member contents, so the archive bytes do not change when a member is
+    rebuilt with the same size and symbols.
+
+    Args:
+        archive: Archive to inspect
+
+    Returns:
+        Member file paths, or an empty list if archive is not a thin archive
+
+    Raises:
+        OSError: If the archive cannot be read
+    """
+    with open(archive, "rb") as f:
+        if f.read(len(_THIN_ARCHIVE_MAGIC)) != _THIN_ARCHIVE_MAGIC:
+            return []
+        data = f.read()
+
+    members: List[Path] = []
+    long_names = b""
+    pos = 0
+    while pos + 60 <= len(data):
+        # 60-byte member header: name[16] ... size[10] at offset 48
+        name = data[pos:pos + 16].rstrip()
+        size = int(data[pos + 48:pos + 58].strip() or 0)
+        pos += 60
+        if name in (b"/", b"/SYM64/", b"//"):
+            # Symbol table and long name table are the only stored contents
+            if name == b"//":
+                long_names = data[pos:pos + size]
+            pos += size + (size & 1)
+            continue
+        if name.startswith(b"/"):
+            offset = int(name[1:])
+            name = long_names[offset:long_names.index(b"/\n", offset)]
+        else:
+            name = name.rstrip(b"/")
+        members.append(archive.parent / os.fsdecode(name))
+    return members
+
 
 class ConfigurableLinkerError(LinkerError):
     """Raised when configurable linking operations fail."""
@@ -42,8 +184,9 @@ class ConfigurableLinker(ILinker):
         framework: IFramework,
         board_id: str,
         build_dir: Path,
-        platform_config: Optional[Union[Dict, Path]] = None,
-        show_progress: bool = True
+        platform_config: Optional[Union[Mapping, Path]] = None,
+        show_progress: bool = True,
+        lto: bool = False
     ):
         """Initialize configurable linker.
 
@@ -55,6 +198,7 @@ class ConfigurableLinker(ILinker):
             build_dir: Directory for build artifacts
             platform_config: Platform config dict or path to config JSON file
             show_progress: Whether to show linking progress
+            lto: Whether to run link-time optimization
         """
         self.platform = platform
         self.toolchain = toolchain
@@ -62,35 +206,63 @@ class ConfigurableLinker(ILinker):
         self.board_id = board_id
         self.build_dir = build_dir
         self.show_progress = show_progress
+        self.lto = lto
+
+        # Optional framework/toolchain capabilities, resolved once (the ESP32
+        # framework provides an SDK, Teensy a single linker script)
+        self._framework_get_linker_script = getattr(framework, 'get_linker_script', None)
+        self._framework_get_sdk_dir = getattr(framework, 'get_sdk_dir', None)
+        self._framework_get_sdk_libs = getattr(framework, 'get_sdk_libs', None)
+        self._toolchain_get_size_path = getattr(toolchain, 'get_size_path', None)
+
+        # Use "firmware.map" instead of board_id to avoid special characters
+        self.map_file = build_dir / "firmware.map"
 
         # Load board configuration
         self.board_config = platform.get_board_json(board_id)  # type: ignore[attr-defined]
 
-        # Get MCU type from board config
-        self.mcu = self.board_config.get("build", {}).get("mcu", "").lower()
+        # Read board build settings once
+        build = self.board_config.get("build", {})
+        self.mcu = build.get("mcu", "").lower()
+        self.flash_mode = build.get("flash_mode", "qio")
+        self.psram_mode = build.get("psram_mode", "qspi")
+        upload = self.board_config.get("upload", {})
+        self.max_flash = upload.get("maximum_size")
+        self.max_ram = upload.get("maximum_ram_size")
+
+        # ESP32-S3 SDKs keep flash/PSRAM-mode specific scripts and libraries
+        # in a "{flash_mode}_{psram_mode}" directory next to "ld"
+        self.flash_dir_name: Optional[str] = (
+            f"{self.flash_mode}_{self.psram_mode}" if self.mcu == "esp32s3" else None
+        )
 
         # Load platform configuration
         if platform_config is None:
             # Try to load from default location
-            config_path = Path(__file__).parent.parent / "platform_configs" / f"{self.mcu}.json"
+            config_path = get_default_config_path(self.mcu)
             if config_path.exists():
-                with open(config_path, 'r') as f:
-                    self.config = json.load(f)
+                self.config = load_platform_config(config_path)
             else:
                 raise ConfigurableLinkerError(
                     f"No platform configuration found for {self.mcu}. " +
                     f"Expected: {config_path}"
                 )
-        elif isinstance(platform_config, dict):
+        elif isinstance(platform_config, Mapping):
             self.config = platform_config
         else:
             # Assume it's a path
-            with open(platform_config, 'r') as f:
-                self.config = json.load(f)
+            self.config = load_platform_config(platform_config)
 
         # Cache for linker paths
         self._linker_scripts_cache: Optional[List[Path]] = None
         self._sdk_libs_cache: Optional[List[Path]] = None
+        self._linker_flags_cache: Optional[List[str]] = None
+        self._linker_info_cache: Optional[Dict[str, Any]] = None
+        self._sdk_mcu_dir: Optional[Path] = None
+        self._command_prefix: Optional[Tuple[str, ...]] = None
+        self._library_group_tail: Optional[Tuple[str, ...]] = None
+        self._size_tool: Optional[Path] = None
+        self._size_tool_resolved = False
 
         # Initialize binary generator
         self.binary_generator = BinaryGenerator(
@@ -114,41 +286,27 @@ class ConfigurableLinker(ILinker):
         scripts = []
 
         # Check if framework has a get_linker_script method (Teensy-style)
-        if hasattr(self.framework, 'get_linker_script'):
-            linker_script = self.framework.get_linker_script(self.board_id)  # type: ignore[attr-defined]
+        if self._framework_get_linker_script is not None:
+            linker_script = self._framework_get_linker_script(self.board_id)
             if linker_script and linker_script.exists():
                 scripts.append(linker_script)
 
         # Otherwise use ESP32-style SDK directory approach
-        elif hasattr(self.framework, 'get_sdk_dir'):
-            # Apply SDK fallback for MCUs not fully supported in the platform
-            # (e.g., esp32c2 can use esp32c3 SDK)
-            from ..packages.sdk_utils import SDKPathResolver
-            sdk_dir = self.framework.get_sdk_dir()  # type: ignore[attr-defined]
-            resolver = SDKPathResolver(sdk_dir, show_progress=False)
-            resolved_mcu = resolver._resolve_mcu(self.mcu)
-
+        elif self._framework_get_sdk_dir is not None:
             # Get linker script directory
-            sdk_ld_dir = sdk_dir / resolved_mcu / "ld"
-
-            if not sdk_ld_dir.exists():
-                raise ConfigurableLinkerError(f"Linker script directory not found: {sdk_ld_dir}")
+            sdk_ld_dir = self._get_sdk_mcu_dir() / "ld"
 
             # Get linker scripts from config
-            config_scripts = self.config.get('linker_scripts', [])
-
-            for script_name in config_scripts:
-                script_path = sdk_ld_dir / script_name
-                if script_path.exists():
-                    scripts.append(script_path)
-                # For ESP32-S3, sections.ld may be in flash mode subdirectories
-                elif self.mcu == "esp32s3" and script_name == "sections.ld":
-                    flash_mode = self.board_config.get("build", {}).get("flash_mode", "qio")
-                    psram_mode = self.board_config.get("build", {}).get("psram_mode", "qspi")
-                    flash_dir = sdk_ld_dir.parent / f"{flash_mode}_{psram_mode}"
-                    alt_script_path = flash_dir / script_name
-                    if alt_script_path.exists():
-                        scripts.append(alt_script_path)
+            config_scripts = tuple(self.config.get('linker_scripts', []))
+
+            key = (sdk_ld_dir, self.mcu, self.flash_mode, self.psram_mode, config_scripts)
+            shared_scripts = _shared_linker_scripts.get(key)
+            if shared_scripts is not None:
+                scripts.extend(shared_scripts)
+            else:
+                scripts.extend(self._find_sdk_linker_scripts(sdk_ld_dir, config_scripts))
+                if scripts:
+                    _shared_linker_scripts[key] = tuple(scripts)
 
         if not scripts:
             raise ConfigurableLinkerError(
@@ -158,6 +316,61 @@ class ConfigurableLinker(ILinker):
         self._linker_scripts_cache = scripts
         return scripts
 
+    def _find_sdk_linker_scripts(self, sdk_ld_dir: Path, config_scripts: Tuple[str, ...]) -> List[Path]:
+        """Find the configured linker scripts in the SDK (ESP32-specific).
+
+        Args:
+            sdk_ld_dir: SDK linker script directory for the MCU
+            config_scripts: Script names from the platform config, in link order
+
+        Returns:
+            List of .ld file paths that exist, in config order
+
+        Raises:
+            ConfigurableLinkerError: If the linker script directory is missing
+        """
+        # List the directory once instead of probing each configured script
+        try:
+            with os.scandir(sdk_ld_dir) as entries:
+                ld_names = {entry.name for entry in entries}
+        except FileNotFoundError:
+            raise ConfigurableLinkerError(f"Linker script directory not found: {sdk_ld_dir}")
+
+        scripts = []
+        for script_name in config_scripts:
+            if script_name in ld_names:
+                scripts.append(sdk_ld_dir / script_name)
+            # For ESP32-S3, sections.ld may be in flash mode subdirectories
+            elif self.flash_dir_name is not None and script_name == "sections.ld":
+                alt_script_path = sdk_ld_dir.parent / self.flash_dir_name / script_name
+                if alt_script_path.exists():
+                    scripts.append(alt_script_path)
+        return scripts
+
+    def _get_sdk_mcu_dir(self) -> Path:
+        """Get the SDK directory for this MCU (ESP32-specific).
+
+        Applies the SDK fallback for MCUs not fully supported in the platform
+        (e.g., esp32c2 can use esp32c3 SDK), so linker scripts and library
+        search paths always come from the same directory.
+
+        Returns:
+            Path to the MCU directory inside the framework SDK
+
+        Raises:
+            ConfigurableLinkerError: If the framework does not provide an SDK
+        """
+        if self._sdk_mcu_dir is None:
+            if self._framework_get_sdk_dir is None:
+                raise ConfigurableLinkerError(f"Framework does not provide an SDK directory for {self.mcu}")
+            from ..packages.sdk_utils import SDKPathResolver
+            sdk_dir = self._framework_get_sdk_dir()
+            resolver = SDKPathResolver(sdk_dir, show_progress=False)
+            sdk_mcu_dir = sdk_dir / resolver._resolve_mcu(self.mcu)
+            self._sdk_mcu_dir = sdk_mcu_dir
+            return sdk_mcu_dir
+        return self._sdk_mcu_dir
+
     def get_sdk_libraries(self) -> List[Path]:
         """Get list of SDK precompiled libraries.
 
@@ -168,12 +381,18 @@ class ConfigurableLinker(ILinker):
             return self._sdk_libs_cache
 
         # Only ESP32 frameworks have SDK libraries
-        if hasattr(self.framework, 'get_sdk_libs'):
-            # Get flash mode from board configuration
-            flash_mode = self.board_config.get("build", {}).get("flash_mode", "qio")
-
-            # Get SDK libraries
-            self._sdk_libs_cache = self.framework.get_sdk_libs(self.mcu, flash_mode)  # type: ignore[attr-defined]
+        if self._framework_get_sdk_libs is not None:
+            sdk_dir = self._framework_get_sdk_dir() if self._framework_get_sdk_dir is not None else None
+            key = (sdk_dir, self.mcu, self.flash_mode)
+            shared_libs = _shared_sdk_libs.get(key)
+            if shared_libs is None:
+                # Drop repeated archives (keeping first-seen order); inside
+                # the library group each extra copy is another archive scan
+                shared_libs = tuple(dict.fromkeys(
+                    self._framework_get_sdk_libs(self.mcu, self.flash_mode)
+                ))
+                _shared_sdk_libs[key] = shared_libs
+            self._sdk_libs_cache = list(shared_libs)
         else:
             # No SDK libraries for this framework (e.g., Teensy)
             self._sdk_libs_cache = []
@@ -186,19 +405,24 @@ class ConfigurableLinker(ILinker):
         Returns:
             List of linker flags
         """
+        if self._linker_flags_cache is not None:
+            return list(self._linker_flags_cache)
+
         flags = []
 
         # Get flags from config
         config_flags = self.config.get('linker_flags', [])
         flags.extend(config_flags)
 
+        # Link-time optimization for release builds
+        if self.lto:
+            flags.extend(LTO_LINK_FLAGS)
+
         # Add map file flag with forward slashes for GCC compatibility
-        # Use "firmware.map" instead of board_id to avoid special characters
-        map_file = self.build_dir / "firmware.map"
-        map_file_str = str(map_file).replace('\\', '/')
-        flags.append(f'-Wl,-Map={map_file_str}')
+        flags.append(f'-Wl,-Map={self.map_file.as_posix()}')
 
-        return flags
+        self._linker_flags_cache = flags
+        return list(flags)
 
     def link(
         self,
@@ -231,20 +455,13 @@ class ConfigurableLinker(ILinker):
         if library_archives is None:
             library_archives = []
 
-        # Get linker tool (use g++ for C++ support)
-        linker_path = self.toolchain.get_gxx_path()
-        if linker_path is None or not linker_path.exists():
-            raise ConfigurableLinkerError(
-                f"Linker not found: {linker_path}. " +
-                "Ensure toolchain is installed."
-            )
-
         # Generate output path if not provided
         if output_elf is None:
             output_elf = self.build_dir / "firmware.elf"
 
-        # Get linker flags
-        linker_flags = self.get_linker_flags()
+        # Build linker command: the board-specific prefix (including the
+        # linker lookup) is built once
+        cmd = list(self._get_command_prefix())
 
         # Get linker scripts
         linker_scripts = self.get_linker_scripts()
@@ -252,100 +469,89 @@ class ConfigurableLinker(ILinker):
         # Get SDK libraries
         sdk_libs = self.get_sdk_libraries()
 
-        # Build linker command
-        cmd = [str(linker_path)]
-        cmd.extend(linker_flags)
-
-        # Add linker script directory to library search path (ESP32-specific)
-        if hasattr(self.framework, 'get_sdk_dir'):
-            ld_dir = self.framework.get_sdk_dir() / self.mcu / "ld"  # type: ignore[attr-defined]
-            cmd.append(f"-L{ld_dir}")
-
-            # For ESP32-S3, also add flash mode directory to search path
-            if self.mcu == "esp32s3":
-                flash_mode = self.board_config.get("build", {}).get("flash_mode", "qio")
-                psram_mode = self.board_config.get("build", {}).get("psram_mode", "qspi")
-                flash_dir = self.framework.get_sdk_dir() / self.mcu / f"{flash_mode}_{psram_mode}"  # type: ignore[attr-defined]
-                if flash_dir.exists():
-                    cmd.append(f"-L{flash_dir}")
-
-            # Add linker scripts with ESP32-specific path handling
-            for script in linker_scripts:
-                if script.parent == ld_dir or (self.mcu == "esp32s3" and script.parent.name.endswith(("_qspi", "_opi"))):
-                    cmd.append(f"-T{script.name}")
-                else:
-                    cmd.append(f"-T{script}")
-        else:
-            # For non-ESP32 platforms (e.g., Teensy), use absolute paths
-            for script in linker_scripts:
-                cmd.append(f"-T{script}")
+        # Link inputs follow the prefix
+        inputs: List[str] = []
 
         # Add object files
-        cmd.extend([str(obj) for obj in object_files])
+        inputs.extend(map(os.fspath, object_files))
 
         # Add core archive
-        cmd.append(str(core_archive))
-
-        # Add SDK library directory to search path (ESP32-specific)
-        if hasattr(self.framework, 'get_sdk_dir'):
-            sdk_lib_dir = self.framework.get_sdk_dir() / self.mcu / "lib"  # type: ignore[attr-defined]
-            if sdk_lib_dir.exists():
-                cmd.append(f"-L{sdk_lib_dir}")
-
-        # Group libraries to resolve circular dependencies
-        cmd.append("-Wl,--start-group")
-
-        # Add user library archives first
-        for lib_archive in library_archives:
-            if lib_archive.exists():
-                cmd.append(str(lib_archive))
-
-        # Add SDK libraries
-        for lib in sdk_libs:
-            cmd.append(str(lib))
+        inputs.append(os.fspath(core_archive))
+
+        # Group libraries to resolve circular dependencies, user library
+        # archives first (the linker reports missing inputs)
+        inputs.append("-Wl,--start-group")
+        inputs.extend(map(os.fspath, library_archives))
+        inputs.extend(self._get_library_group_tail())
+
+        # Skip the link when no input changed since output_elf was produced
+        input_files = [
+            *object_files,
+            *self._expand_thin_archive(core_archive),
+            *library_archives,
+            *sdk_libs,
+            *linker_scripts,
+        ]
+        fingerprint_file = output_elf.with_name(f".{output_elf.name}.fp")
+        fingerprint = self._compute_link_fingerprint(cmd + inputs, input_files)
+        if fingerprint is not None and output_elf.exists() and self._read_fingerprint(fingerprint_file) == fingerprint:
+            if self.show_progress:
+                print("✓ firmware.elf is up to date")
+            return output_elf
 
-        # Add standard libraries
-        cmd.extend([
-            "-lgcc",
-            "-lstdc++",
-            "-lm",
-            "-lc",
-        ])
+        # Otherwise reuse an earlier link of identical input contents
+        link_key = self._compute_link_key(cmd + inputs, input_files)
+        if link_key is not None and self._restore_cached_link(link_key, output_elf):
+            if self.show_progress:
+                print("✓ Reused cached firmware.elf (link inputs unchanged)")
+            self._write_fingerprint(fingerprint_file, fingerprint)
+            return output_elf
 
-        cmd.append("-Wl,--end-group")
+        # Everything but the linker itself goes into a response file, which
+        # keeps the command line short regardless of how many flags, scripts,
+        # objects and libraries are linked
+        response_file = self._write_response_file([*cmd[1:], *inputs])
+        cmd = [cmd[0], f"@{response_file}"]
 
         # Add output
-        cmd.extend(["-o", str(output_elf)])
+        cmd.extend(["-o", os.fspath(output_elf)])
 
         # Execute linker
         if self.show_progress:
-            print("Linking firmware.elf...")
-            print(f"  Object files: {len(object_files)}")
-            print(f"  Core archive: {core_archive.name}")
-            print(f"  SDK libraries: {len(sdk_libs)}")
-            print(f"  Linker scripts: {len(linker_scripts)}")
+            print(
+                "\n".join(
+                    [
+                        "Linking firmware.elf...",
+                        f"  Object files: {len(object_files)}",
+                        f"  Core archive: {core_archive.name}",
+                        f"  SDK libraries: {len(sdk_libs)}",
+                        f"  Linker scripts: {len(linker_scripts)}",
+                    ]
+                )
+            )
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            timeout = max(_LINK_TIMEOUT, _LINK_TIMEOUT_PER_INPUT * len(inputs))
+            returncode, output_tail = self._run_linker(cmd, timeout)
 
-            if result.returncode != 0:
+            if returncode != 0:
                 error_msg = "Linking failed\n"
-                error_msg += f"stderr: {result.stderr}\n"
-                error_msg += f"stdout: {result.stdout}"
+                error_msg += f"stderr: {output_tail}"
                 raise ConfigurableLinkerError(error_msg)
 
-            if not output_elf.exists():
+            # A single stat both confirms the output exists and gives its size
+            try:
+                size = output_elf.stat().st_size
+            except FileNotFoundError:
                 raise ConfigurableLinkerError(f"firmware.elf was not created: {output_elf}")
 
             if self.show_progress:
-                size = output_elf.stat().st_size
                 print(f"✓ Created firmware.elf: {size:,} bytes ({size / 1024 / 1024:.2f} MB)")
 
+            if link_key is not None:
+                self._store_cached_link(link_key, output_elf)
+            self._write_fingerprint(fingerprint_file, fingerprint)
+
             return output_elf
 
         except subprocess.TimeoutExpired:
@@ -357,6 +563,333 @@ class ConfigurableLinker(ILinker):
         except Exception as e:
             raise ConfigurableLinkerError(f"Failed to link: {e}")
 
+    def _get_command_prefix(self) -> Tuple[str, ...]:
+        """Get the linker command up to the link inputs.
+
+        The linker, flags, search paths and linker scripts are fixed for a
+        board, so the prefix is built on the first link and then reused.
+
+        Returns:
+            Immutable command prefix
+
+        Raises:
+            ConfigurableLinkerError: If the linker is not installed
+        """
+        if self._command_prefix is not None:
+            return self._command_prefix
+
+        # Get linker tool (use g++ for C++ support)
+        linker_path = self.toolchain.get_gxx_path()
+        if linker_path is None or not linker_path.exists():
+            raise ConfigurableLinkerError(
+                f"Linker not found: {linker_path}. " +
+                "Ensure toolchain is installed."
+            )
+
+        linker_scripts = self.get_linker_scripts()
+        cmd = [os.fspath(linker_path)]
+        cmd.extend(self.get_linker_flags())
+
+        # Add linker script and SDK library directories to the search path
+        # (ESP32-specific)
+        if self._framework_get_sdk_dir is not None:
+            sdk_mcu_dir = self._get_sdk_mcu_dir()
+            ld_dir = sdk_mcu_dir / "ld"
+            cmd.append(f"-L{ld_dir}")
+            search_dirs = {ld_dir}
+
+            # For ESP32-S3, also add flash mode directory to search path (ld
+            # ignores missing search directories, so no existence check)
+            if self.flash_dir_name is not None:
+                flash_dir = sdk_mcu_dir / self.flash_dir_name
+                cmd.append(f"-L{flash_dir}")
+                search_dirs.add(flash_dir)
+
+            cmd.append(f"-L{sdk_mcu_dir / 'lib'}")
+
+            # Add linker scripts with ESP32-specific path handling: scripts in a
+            # directory on the search path are referenced by name only
+            cmd.extend(
+                f"-T{script.name}" if script.parent in search_dirs else f"-T{script}"
+                for script in linker_scripts
+            )
+        else:
+            # For non-ESP32 platforms (e.g., Teensy), use absolute paths
+            cmd.extend(f"-T{script}" for script in linker_scripts)
+
+        self._command_prefix = tuple(cmd)
+        return self._command_prefix
+
+    def _get_library_group_tail(self) -> Tuple[str, ...]:
+        """Get the SDK and standard libraries that close the library group.
+
+        Returns:
+            Immutable tail of the library group, including --end-group
+        """
+        if self._library_group_tail is None:
+            self._library_group_tail = (
+                *map(os.fspath, self.get_sdk_libraries()),
+                *_STANDARD_LIBS,
+                "-Wl,--end-group",
+            )
+        return self._library_group_tail
+
+    @staticmethod
+    def _expand_thin_archive(archive: Path) -> List[Path]:
+        """Get an archive followed by the member files it references.
+
+        Args:
+            archive: Archive passed to the linker
+
+        Returns:
+            The archive, plus its members if it is a thin archive
+        """
+        try:
+            return [archive, *_thin_archive_members(archive)]
+        except (OSError, ValueError):
+            # Unreadable or malformed: the linker reports it
+            return [archive]
+
+    def _compute_link_fingerprint(self, args: List[str], input_files: List[Path]) -> Optional[str]:
+        """Compute a cheap fingerprint of the link from input timestamps.
+
+        Unlike the link cache key, only the size and modification time of
+        each input are used, so an up-to-date check costs one stat per input.
+
+        Args:
+            args: Linker arguments, excluding the output path
+            input_files: Files read by the linker (objects, archives, scripts)
+
+        Returns:
+            Hex fingerprint, or None if an input is missing
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for arg in args:
+            h.update(arg.encode("utf-8"))
+            h.update(b"\0")
+        try:
+            for path in input_files:
+                st = os.stat(path)
+                h.update(f"{st.st_mtime_ns}:{st.st_size}\0".encode("ascii"))
+        except OSError:
+            return None
+        return h.hexdigest()
+
+    @staticmethod
+    def _read_fingerprint(fingerprint_file: Path) -> Optional[str]:
+        """Read the fingerprint recorded for the previous link.
+
+        Args:
+            fingerprint_file: Fingerprint file next to the output ELF
+
+        Returns:
+            Recorded fingerprint, or None if there is none
+        """
+        try:
+            return fingerprint_file.read_text(encoding="ascii")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    @staticmethod
+    def _write_fingerprint(fingerprint_file: Path, fingerprint: Optional[str]) -> None:
+        """Record the fingerprint of a completed link.
+
+        Args:
+            fingerprint_file: Fingerprint file next to the output ELF
+            fingerprint: Fingerprint of the link inputs, or None to clear it
+        """
+        try:
+            if fingerprint is None:
+                fingerprint_file.unlink(missing_ok=True)
+            else:
+                fingerprint_file.write_text(fingerprint, encoding="ascii")
+        except OSError:
+            # A missing fingerprint only costs a content check on the next link
+            pass
+
+    def _compute_link_key(self, args: List[str], input_files: List[Path]) -> Optional[str]:
+        """Compute the link cache key from the command and input contents.
+
+        Args:
+            args: Linker arguments, excluding the output path
+            input_files: Files read by the linker (objects, archives, scripts)
+
+        Returns:
+            Hex cache key, or None if an input cannot be read (the linker
+            then runs and reports it)
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for arg in args:
+            h.update(arg.encode("utf-8"))
+            h.update(b"\0")
+        try:
+            with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as executor:
+                for digest in executor.map(_hash_file_cached, input_files):
+                    h.update(digest)
+        except OSError:
+            return None
+        return h.hexdigest()
+
+    def _get_link_cache_entry(self, link_key: str) -> Path:
+        """Get the link cache directory for a cache key.
+
+        Args:
+            link_key: Link cache key
+
+        Returns:
+            Directory holding the cached firmware.elf and firmware.map
+        """
+        return self._get_link_cache_dir() / link_key
+
+    def _get_link_cache_dir(self) -> Path:
+        """Get the directory holding all link cache entries.
+
+        The cache lives next to the build directory rather than inside it,
+        so a clean build (which discards the build directory) keeps it.
+
+        Returns:
+            Link cache directory
+        """
+        return self.build_dir.parent / ".zapio_link_cache"
+
+    def _restore_cached_link(self, link_key: str, output_elf: Path) -> bool:
+        """Copy a cached link result into place.
+
+        Args:
+            link_key: Link cache key
+            output_elf: Destination for firmware.elf
+
+        Returns:
+            True if the cached result was restored
+        """
+        entry = self._get_link_cache_entry(link_key)
+        # Copy directly and treat a missing entry as a miss, rather than
+        # probing for it first
+        try:
+            shutil.copyfile(entry / "firmware.elf", output_elf)
+        except OSError:
+            return False
+        try:
+            shutil.copyfile(entry / "firmware.map", self.map_file)
+        except OSError:
+            # Entry stored without a map file
+            pass
+        try:
+            # Mark the entry as recently used for pruning
+            os.utime(entry)
+        except OSError:
+            pass
+        return True
+
+    def _store_cached_link(self, link_key: str, output_elf: Path) -> None:
+        """Add a successful link result to the cache.
+
+        Files are copied under a temporary name and renamed into place, and
+        firmware.elf is stored last, so a partially written entry is never
+        used.
+
+        Args:
+            link_key: Link cache key
+            output_elf: Linked firmware.elf
+        """
+        entry = self._get_link_cache_entry(link_key)
+        try:
+            entry.mkdir(parents=True, exist_ok=True)
+            for source, name in ((self.map_file, "firmware.map"), (output_elf, "firmware.elf")):
+                if source.exists():
+                    tmp = entry / f"{name}.tmp"
+                    shutil.copyfile(source, tmp)
+                    os.replace(tmp, entry / name)
+            os.utime(entry)
+        except OSError:
+            # The cache is an optimization; a failed store only costs a relink
+            pass
+        self._prune_link_cache()
+
+    def _prune_link_cache(self) -> None:
+        """Remove the least recently used link cache entries beyond the cap."""
+        try:
+            with os.scandir(self._get_link_cache_dir()) as it:
+                entries = [(e.stat().st_mtime_ns, e.path) for e in it if e.is_dir()]
+        except OSError:
+            return
+        entries.sort(reverse=True)
+        for _, path in entries[_LINK_CACHE_MAX_ENTRIES:]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _write_response_file(self, args: List[str]) -> Path:
+        """Write linker arguments to a response file.
+
+        Arguments are written one per line. Each is quoted and escaped the
+        way gcc reads @file arguments, so paths containing spaces or
+        backslashes are kept intact.
+
+        Args:
+            args: Linker arguments
+
+        Returns:
+            Path to the response file
+        """
+        response_file = self.build_dir / "link.rsp"
+        response_file.parent.mkdir(parents=True, exist_ok=True)
+        response_file.write_text(
+            "\n".join(quote_response_arg(arg) for arg in args),
+            encoding="utf-8"
+        )
+        return response_file
+
+    def _run_linker(self, cmd: List[str], timeout: float) -> Tuple[int, str]:
+        """Run the linker, streaming its diagnostics as they are produced.
+
+        Diagnostics are echoed live when showing progress, and only the last
+        lines are kept in memory for the error report.
+
+        Args:
+            cmd: Full linker command
+            timeout: Seconds after which the linker is killed
+
+        Returns:
+            Tuple of (return code, trailing diagnostic output)
+
+        Raises:
+            subprocess.TimeoutExpired: If the linker runs past the timeout
+        """
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, kill_on_timeout)
+        timer.start()
+        tail: deque = deque(maxlen=_LINK_OUTPUT_TAIL_LINES)
+        try:
+            assert proc.stderr is not None
+            for raw_line in proc.stderr:
+                line = raw_line.decode("utf-8", errors="replace")
+                tail.append(line)
+                if self.show_progress:
+                    print(line, end="")
+            returncode = proc.wait()
+        finally:
+            # Also reached on KeyboardInterrupt: never leave the linker running
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            if proc.stderr is not None:
+                proc.stderr.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return returncode, "".join(tail)
+
     def generate_bin(self, elf_path: Path, output_bin: Optional[Path] = None) -> Path:
         """Generate firmware.bin from firmware.elf.
 
@@ -417,24 +950,28 @@ class ConfigurableLinker(ILinker):
         ]
 
         try:
+            # Diagnostics go to stderr; discard stdout and keep stderr as raw
+            # bytes, only decoded when reporting a failure
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=30
             )
 
             if result.returncode != 0:
                 error_msg = "HEX generation failed\n"
-                error_msg += f"stderr: {result.stderr}\n"
-                error_msg += f"stdout: {result.stdout}"
+                error_msg += f"stderr: {result.stderr.decode('utf-8', errors='replace')}"
                 raise ConfigurableLinkerError(error_msg)
 
-            if not output_hex.exists():
+            # A single stat both confirms the output exists and gives its size
+            try:
+                size = output_hex.stat().st_size
+            except FileNotFoundError:
                 raise ConfigurableLinkerError(f"firmware.hex was not created: {output_hex}")
 
             if self.show_progress:
-                size = output_hex.stat().st_size
                 print(f"✓ Created firmware.hex: {size:,} bytes")
 
             return output_hex
@@ -448,6 +985,37 @@ class ConfigurableLinker(ILinker):
         except Exception as e:
             raise ConfigurableLinkerError(f"Failed to generate HEX: {e}")
 
+    def _get_size_tool(self) -> Optional[Path]:
+        """Get the size tool (e.g., arm-none-eabi-size) for this toolchain.
+
+        The lookup is done on first use and remembered, so repeated size
+        queries do not probe the toolchain directory again.
+
+        Returns:
+            Path to the size tool, or None if it cannot be found
+        """
+        if self._size_tool_resolved:
+            return self._size_tool
+
+        size_tool: Optional[Path] = None
+        if self._toolchain_get_size_path is not None:
+            size_tool = self._toolchain_get_size_path()
+            if size_tool is not None and not size_tool.exists():
+                size_tool = None
+        else:
+            # Fall back to looking for size tool in toolchain bin directory
+            gcc_path = self.toolchain.get_gcc_path()
+            if gcc_path is not None:
+                toolchain_bin = gcc_path.parent
+                for name in ("arm-none-eabi-size", "arm-none-eabi-size.exe"):
+                    if (toolchain_bin / name).exists():
+                        size_tool = toolchain_bin / name
+                        break
+
+        self._size_tool = size_tool
+        self._size_tool_resolved = True
+        return size_tool
+
     def get_size_info(self, elf_path: Path):
         """Get firmware size information from ELF file.
 
@@ -465,41 +1033,26 @@ class ConfigurableLinker(ILinker):
         if not elf_path.exists():
             raise ConfigurableLinkerError(f"ELF file not found: {elf_path}")
 
-        # Get arm-none-eabi-size or appropriate size tool from toolchain
-        # Check if toolchain has a get_size_path method
-        if hasattr(self.toolchain, 'get_size_path'):
-            size_tool = self.toolchain.get_size_path()
-        else:
-            # Fall back to looking for size tool in toolchain bin directory
-            gcc_path = self.toolchain.get_gcc_path()
-            if gcc_path is None:
-                return None
-            toolchain_bin = gcc_path.parent
-            size_tool = toolchain_bin / "arm-none-eabi-size"
-            if not size_tool.exists():
-                size_tool = toolchain_bin / "arm-none-eabi-size.exe"
-
-        if size_tool and not size_tool.exists():
+        size_tool = self._get_size_tool()
+        if size_tool is None:
             # If we can't find the size tool, return None (non-fatal)
             return None
 
         try:
             result = subprocess.run(
                 [str(size_tool), str(elf_path)],
-                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,  # Only the size table is used
                 text=True,
                 timeout=10
             )
 
             if result.returncode == 0:
-                # Get max flash and RAM from board config
-                max_flash = self.board_config.get("upload", {}).get("maximum_size")
-                max_ram = self.board_config.get("upload", {}).get("maximum_ram_size")
-
                 return SizeInfo.parse(
                     result.stdout,
-                    max_flash=max_flash,
-                    max_ram=max_ram
+                    max_flash=self.max_flash,
+                    max_ram=self.max_ram
                 )
             else:
                 return None
@@ -559,6 +1112,9 @@ class ConfigurableLinker(ILinker):
         Returns:
             Dictionary with linker information
         """
+        if self._linker_info_cache is not None:
+            return dict(self._linker_info_cache)
+
         info = {
             'board_id': self.board_id,
             'mcu': self.mcu,
@@ -592,4 +1148,5 @@ class ConfigurableLinker(ILinker):
         except Exception as e:
             info['sdk_libraries_error'] = str(e)
 
-        return info
+        self._linker_info_cache = info
+        return dict(info)
@@ -7,11 +7,61 @@ Design:
     - Parses flag strings with proper handling of quoted values
     - Builds flags from configuration dictionaries
     - Adds platform-specific defines (Arduino, ESP32, etc.)
-    - Merges user build flags from platformio.ini
+    - Merges user build flags from platformio.ini, resolving relative
+      include directories against the project directory
+    - Flags are built once per builder and shared as immutable tuples
+    - Link-time optimization is opt-in (build_type = release)
 """
 
+import functools
+import re
 import shlex
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Mapping, Optional, Tuple
+
+
+# Characters that require shlex's quote/escape handling; strings without any
+# of them split identically with str.split()
+_SHELL_QUOTE_RE = re.compile(r'["\'\\]')
+
+# Board and user flags forwarded to the compiler: defines (-D), undefines
+# (-U), include directories (-I) and warning options (-W, but not the
+# -Wl,/-Wa,/-Wp, pass-through options for the linker, assembler and
+# preprocessor)
+_FORWARDED_FLAG_RE = re.compile(r'-(?:[DIU]|W(?![lap],))')
+
+# Forwarded options that may take their value as the next argument
+# ("-I include" instead of "-Iinclude")
+_SEPARATE_VALUE_FLAGS = frozenset(('-D', '-U', '-I'))
+
+# Link-time optimization flags. Objects keep regular code alongside the LTO
+# bytecode ("fat" objects) because the core and libraries are archived with
+# plain ar, whose symbol index does not cover LTO-only objects
+LTO_COMPILE_FLAGS = ('-flto=auto', '-ffat-lto-objects')
+LTO_LINK_FLAGS = ('-flto=auto',)
+
+
+@functools.lru_cache(maxsize=1024)
+def _shlex_split_cached(flag_string: str) -> Tuple[str, ...]:
+    """Split a quoted flag string with shlex, memoized per string.
+
+    Platform and board configs feed the same few flag strings to every
+    builder, so each distinct string only goes through the lexer once.
+
+    Args:
+        flag_string: String containing compiler flags
+
+    Returns:
+        Tuple of flags, or a plain whitespace split if the quoting is invalid
+    """
+    try:
+        return tuple(shlex.split(flag_string))
+    except KeyboardInterrupt as ke:
+        from fbuild.interrupt_utils import handle_keyboard_interrupt_properly
+        handle_keyboard_interrupt_properly(ke)
+        raise  # Never reached, but satisfies type checker
+    except Exception:
+        return tuple(flag_string.split())
 
 
 class FlagBuilderError(Exception):
@@ -31,11 +81,13 @@ class FlagBuilder:
 
     def __init__(
         self,
-        config: Dict[str, Any],
+        config: Mapping[str, Any],
         board_config: Dict[str, Any],
         board_id: str,
         variant: str,
-        user_build_flags: Optional[List[str]] = None
+        user_build_flags: Optional[List[str]] = None,
+        lto: bool = False,
+        project_dir: Optional[Path] = None
     ):
         """Initialize flag builder.
 
@@ -45,12 +97,20 @@ class FlagBuilder:
             board_id: Board identifier (e.g., "esp32-c6-devkitm-1")
             variant: Board variant name
             user_build_flags: Build flags from platformio.ini
+            lto: Whether to compile for link-time optimization
+            project_dir: Project directory that relative -I paths in the
+                user build flags are resolved against
         """
         self.config = config
         self.board_config = board_config
         self.board_id = board_id
         self.variant = variant
         self.user_build_flags = user_build_flags or []
+        self.lto = lto
+        self.project_dir = project_dir
+
+        # Flags frozen on the first build_flags() call
+        self._flags_frozen: Optional[Dict[str, Tuple[str, ...]]] = None
 
     @staticmethod
     def parse_flag_string(flag_string: str) -> List[str]:
@@ -60,28 +120,38 @@ class FlagBuilder:
             flag_string: String containing compiler flags
 
         Returns:
-            List of individual flags with quotes preserved
+            List of individual flags with shell quoting resolved
 
         Example:
             >>> FlagBuilder.parse_flag_string('-DFOO="bar baz" -DTEST')
-            ['-DFOO="bar baz"', '-DTEST']
+            ['-DFOO=bar baz', '-DTEST']
         """
-        try:
-            return shlex.split(flag_string)
-        except KeyboardInterrupt as ke:
-            from fbuild.interrupt_utils import handle_keyboard_interrupt_properly
-            handle_keyboard_interrupt_properly(ke)
-            raise  # Never reached, but satisfies type checker
-        except Exception:
+        # Fast path: plain whitespace-separated flags don't need the shlex lexer
+        if not _SHELL_QUOTE_RE.search(flag_string):
             return flag_string.split()
 
-    def build_flags(self) -> Dict[str, List[str]]:
+        return list(_shlex_split_cached(flag_string))
+
+    def build_flags(self) -> Dict[str, Tuple[str, ...]]:
         """Build compilation flags from configuration.
 
+        The flags are built on the first call and the same immutable result is
+        returned afterwards; callers needing a mutable list copy it themselves.
+
+        Returns:
+            Dictionary with 'cflags', 'cxxflags', and 'common' keys
+        """
+        if self._flags_frozen is None:
+            self._flags_frozen = {k: tuple(v) for k, v in self._build_flag_lists().items()}
+        return self._flags_frozen
+
+    def _build_flag_lists(self) -> Dict[str, List[str]]:
+        """Assemble compilation flags from configuration.
+
         Returns:
             Dictionary with 'cflags', 'cxxflags', and 'common' keys
         """
-        flags = {
+        flags: Dict[str, List[str]] = {
             'common': [],  # Common flags for both C and C++
             'cflags': [],  # C-specific flags
             'cxxflags': []  # C++-specific flags
@@ -119,6 +189,10 @@ class FlagBuilder:
         # Add user build flags from platformio.ini
         self._add_user_flags(flags)
 
+        # Add link-time optimization flags for release builds
+        if self.lto:
+            flags['common'].extend(LTO_COMPILE_FLAGS)
+
         return flags
 
     def _add_arduino_defines(self, flags: Dict[str, List[str]]) -> None:
@@ -147,32 +221,57 @@ class FlagBuilder:
         Args:
             flags: Flags dictionary to update
         """
-        build_config = self.board_config.get("build", {})
-        extra_flags = build_config.get("extra_flags", "")
+        extra_flags = self.board_config.get("build", {}).get("extra_flags")
+        if not extra_flags:
+            return
 
-        if extra_flags:
-            if isinstance(extra_flags, str):
-                flag_list = extra_flags.split()
-            else:
-                flag_list = extra_flags
-
-            for flag in flag_list:
-                if flag.startswith('-D'):
-                    flags['common'].append(flag)
+        flag_list = extra_flags.split() if isinstance(extra_flags, str) else extra_flags
+        flags['common'].extend(self._forward_flags(flag_list, None))
 
     def _add_user_flags(self, flags: Dict[str, List[str]]) -> None:
         """Add user build flags from platformio.ini.
 
-        These override/extend board defaults.
+        These override/extend board defaults. Only defines, undefines,
+        include directories and warning options are forwarded.
 
         Args:
             flags: Flags dictionary to update
         """
-        for flag in self.user_build_flags:
-            if flag.startswith('-D'):
-                # Add defines to common flags
-                flags['common'].append(flag)
-            # Could extend to handle other flag types if needed
+        flags['common'].extend(self._forward_flags(self.user_build_flags, self.project_dir))
+
+    @staticmethod
+    def _forward_flags(flag_list: Iterable[str], base_dir: Optional[Path]) -> List[str]:
+        """Select the board/user flags that are forwarded to the compiler.
+
+        A bare -D, -U or -I is joined with the following argument, so
+        "-I include" stays one include flag instead of turning the next flag
+        into the include directory.
+
+        Args:
+            flag_list: Flags split into arguments
+            base_dir: Directory relative include paths are resolved against,
+                or None to keep them as given
+
+        Returns:
+            Forwarded flags in their original order
+        """
+        forwarded = []
+        args = iter(flag_list)
+        for flag in args:
+            if flag in _SEPARATE_VALUE_FLAGS:
+                value = next(args, None)
+                if value is None:
+                    break
+                flag += value
+            elif not _FORWARDED_FLAG_RE.match(flag):
+                continue
+
+            if base_dir is not None and flag.startswith('-I'):
+                include_dir = Path(flag[2:])
+                if not include_dir.is_absolute():
+                    flag = f'-I{base_dir / include_dir}'
+            forwarded.append(flag)
+        return forwarded
 
     def get_base_flags_for_library(self) -> List[str]:
         """Get base compiler flags for library compilation.
@@ -181,6 +280,4 @@ class FlagBuilder:
             List of compiler flags suitable for library compilation
         """
         flags = self.build_flags()
-        base_flags = flags['common'].copy()
-        base_flags.extend(flags['cxxflags'])
-        return base_flags
+        return [*flags['common'], *flags['cxxflags']]
@@ -23,7 +23,6 @@ from ..packages.library_manager import LibraryError
 from .source_scanner import SourceScanner, SourceCollection
 from .compiler import CompilerError as CompilerImportError
 from .linker import LinkerError as LinkerImportError
-from .orchestrator_esp32 import OrchestratorESP32
 from .build_utils import SizeInfoPrinter
 from .library_dependency_processor import LibraryDependencyProcessor
 from .source_compilation_orchestrator import (
@@ -388,6 +387,9 @@ class BuildOrchestratorAVR(IBuildOrchestrator):
                 message="Cache is required for ESP32 builds"
             )
 
+        # Delegate to OrchestratorESP32 for native ESP32 build
+        from .orchestrator_esp32 import OrchestratorESP32
+
         esp32_orchestrator = OrchestratorESP32(self.cache, verbose)
         # Use the new BaseBuildOrchestrator-compliant interface
         result = esp32_orchestrator.build(
@@ -5,9 +5,14 @@ This module handles ESP32 platform builds separately from AVR builds,
 providing cleaner separation of concerns and better maintainability.
 """
 
+import json
+import os
+import shutil
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from ..packages import Cache
@@ -20,7 +25,18 @@ from .configurable_compiler import ConfigurableCompiler
 from .configurable_linker import ConfigurableLinker
 from .linker import SizeInfo
 from .orchestrator import IBuildOrchestrator, BuildResult
-from .build_utils import safe_rmtree
+from .build_utils import discard_tree
+
+# Installed packages reused by later builds in the same process (e.g. the
+# daemon), keyed by cache root and package URLs. An entry is replaced when its
+# package is no longer installed.
+_platform_instances: Dict[Tuple[str, ...], PlatformESP32] = {}
+_toolchain_instances: Dict[Tuple[str, ...], ToolchainESP32] = {}
+_framework_instances: Dict[Tuple[str, ...], FrameworkESP32] = {}
+
+# Core archives kept in the shared core archive cache; the least recently used
+# are pruned beyond this (every framework reinstall produces a new key)
+_CORE_ARCHIVE_CACHE_MAX_ENTRIES = 8
 
 
 @dataclass
@@ -180,8 +196,12 @@ class OrchestratorESP32(IBuildOrchestrator):
             if verbose:
                 print("[3/10] Initializing ESP32 platform...")
 
-            platform = PlatformESP32(self.cache, platform_url, show_progress=verbose)
-            platform.ensure_platform()
+            platform_key = (str(self.cache.cache_root), platform_url)
+            platform = _platform_instances.get(platform_key)
+            if platform is None or not platform.is_installed():
+                platform = PlatformESP32(self.cache, platform_url, show_progress=verbose)
+                platform.ensure_platform()
+                _platform_instances[platform_key] = platform
 
             # Get board configuration
             board_json = platform.get_board_json(board_id)
@@ -213,6 +233,10 @@ class OrchestratorESP32(IBuildOrchestrator):
             # Setup build directory
             build_dir = self._setup_build_directory(env_name, clean, verbose)
 
+            # Link-time optimization is opt-in, so debug and default builds
+            # keep fast incremental links
+            lto = env_config.get('build_type', '').strip().lower() == 'release'
+
             # Initialize compiler
             if verbose:
                 print("[7/10] Compiling Arduino core...")
@@ -225,22 +249,31 @@ class OrchestratorESP32(IBuildOrchestrator):
                 build_dir,
                 platform_config=None,
                 show_progress=verbose,
-                user_build_flags=build_flags
+                user_build_flags=build_flags,
+                object_cache_dir=self.cache.object_cache_dir,
+                lto=lto,
+                project_dir=project_dir
             )
 
-            # Compile Arduino core
-            core_obj_files = compiler.compile_core()
+            # Reuse a core archive built from the same inputs, if any
+            core_key = compiler.get_core_archive_key()
+            core_archive = self._restore_core_archive(core_key, build_dir, verbose)
 
-            # Add Bluetooth stub for non-ESP32 targets (ESP32-C6, ESP32-S3, etc.)
-            # where esp32-hal-bt.c fails to compile but btInUse() is still referenced
-            bt_stub_obj = self._create_bt_stub(build_dir, compiler, verbose)
-            if bt_stub_obj:
-                core_obj_files.append(bt_stub_obj)
+            if core_archive is None:
+                # Compile Arduino core
+                core_obj_files = compiler.compile_core()
 
-            core_archive = compiler.create_core_archive(core_obj_files)
+                # Add Bluetooth stub for non-ESP32 targets (ESP32-C6, ESP32-S3, etc.)
+                # where esp32-hal-bt.c fails to compile but btInUse() is still referenced
+                bt_stub_obj = self._create_bt_stub(build_dir, compiler, verbose)
+                if bt_stub_obj:
+                    core_obj_files.append(bt_stub_obj)
 
-            if verbose:
-                print(f"      Compiled {len(core_obj_files)} core source files")
+                core_archive = compiler.create_core_archive(core_obj_files)
+                self._store_core_archive(core_key, compiler, core_obj_files, verbose)
+
+                if verbose:
+                    print(f"      Compiled {len(core_obj_files)} core source files")
 
             # Handle library dependencies
             library_archives, library_include_paths = self._process_libraries(
@@ -270,7 +303,8 @@ class OrchestratorESP32(IBuildOrchestrator):
                 board_id,
                 build_dir,
                 platform_config=None,
-                show_progress=verbose
+                show_progress=verbose,
+                lto=lto
             )
 
             # Link firmware
@@ -280,12 +314,23 @@ class OrchestratorESP32(IBuildOrchestrator):
             if verbose:
                 print("[10/10] Generating firmware binary...")
 
-            firmware_bin = linker.generate_bin(firmware_elf)
-
-            # Generate bootloader and partition table
-            bootloader_bin, partitions_bin = self._generate_boot_components(
-                linker, mcu, verbose
-            )
+            # The bootloader and partition table do not depend on firmware.elf,
+            # so each is generated on its own thread alongside elf2image
+            # (in-process esptool runs serialize on a lock, but the
+            # gen_esp32part subprocess overlaps with them)
+            bootloader_bin = None
+            partitions_bin = None
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                boot_futures = None
+                if mcu.startswith("esp32"):
+                    boot_futures = (
+                        executor.submit(self._generate_bootloader, linker, verbose),
+                        executor.submit(self._generate_partition_table, linker, verbose),
+                    )
+                firmware_bin = linker.generate_bin(firmware_elf)
+                if boot_futures is not None:
+                    bootloader_bin = boot_futures[0].result()
+                    partitions_bin = boot_futures[1].result()
 
             build_time = time.time() - start_time
 
@@ -312,7 +357,6 @@ class OrchestratorESP32(IBuildOrchestrator):
             raise  # Never reached, but satisfies type checker
         except Exception as e:
             build_time = time.time() - start_time
-            import traceback
             error_trace = traceback.format_exc()
             return BuildResultESP32(
                 success=False,
@@ -351,13 +395,17 @@ class OrchestratorESP32(IBuildOrchestrator):
 
         # Determine toolchain type
         toolchain_type = "riscv32-esp" if "riscv32" in toolchain_url else "xtensa-esp-elf"
-        toolchain = ToolchainESP32(
-            self.cache,
-            toolchain_url,
-            toolchain_type,
-            show_progress=verbose
-        )
-        toolchain.ensure_toolchain()
+        toolchain_key = (str(self.cache.cache_root), toolchain_url)
+        toolchain = _toolchain_instances.get(toolchain_key)
+        if toolchain is None or not toolchain.is_installed():
+            toolchain = ToolchainESP32(
+                self.cache,
+                toolchain_url,
+                toolchain_type,
+                show_progress=verbose
+            )
+            toolchain.ensure_toolchain()
+            _toolchain_instances[toolchain_key] = toolchain
         return toolchain
 
     def _setup_framework(
@@ -393,14 +441,18 @@ class OrchestratorESP32(IBuildOrchestrator):
                 skeleton_lib_url = package_url
                 break
 
-        framework = FrameworkESP32(
-            self.cache,
-            framework_url,
-            libs_url,
-            skeleton_lib_url=skeleton_lib_url,
-            show_progress=verbose
-        )
-        framework.ensure_framework()
+        framework_key = (str(self.cache.cache_root), framework_url, libs_url, skeleton_lib_url or "")
+        framework = _framework_instances.get(framework_key)
+        if framework is None or not framework.is_installed():
+            framework = FrameworkESP32(
+                self.cache,
+                framework_url,
+                libs_url,
+                skeleton_lib_url=skeleton_lib_url,
+                show_progress=verbose
+            )
+            framework.ensure_framework()
+            _framework_instances[framework_key] = framework
         return framework
 
     def _setup_build_directory(self, env_name: str, clean: bool, verbose: bool) -> Path:
@@ -420,9 +472,12 @@ class OrchestratorESP32(IBuildOrchestrator):
         if clean and build_dir.exists():
             if verbose:
                 print("[6/10] Cleaning build directory...")
-            safe_rmtree(build_dir)
+            discard_tree(build_dir)
 
         build_dir.mkdir(parents=True, exist_ok=True)
+
+        # Objects are shared between environments through the object cache
+        self.cache.object_cache_dir.mkdir(parents=True, exist_ok=True)
         return build_dir
 
     def _process_libraries(
@@ -521,12 +576,17 @@ class OrchestratorESP32(IBuildOrchestrator):
         if verbose:
             print("[8/10] Compiling sketch...")
 
-        # Look for .ino files in the project directory
-        sketch_files = list(project_dir.glob("*.ino"))
-        if not sketch_files:
+        # Use the first .ino file in the project directory, stopping the scan
+        # as soon as one is found
+        sketch_path = None
+        with os.scandir(project_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".ino") and entry.is_file():
+                    sketch_path = Path(entry.path)
+                    break
+        if sketch_path is None:
             return None
 
-        sketch_path = sketch_files[0]
         sketch_obj_files = compiler.compile_sketch(sketch_path)
 
         if verbose:
@@ -534,6 +594,116 @@ class OrchestratorESP32(IBuildOrchestrator):
 
         return sketch_obj_files
 
+    def _restore_core_archive(
+        self,
+        core_key: str,
+        build_dir: Path,
+        verbose: bool
+    ) -> Optional[Path]:
+        """
+        Restore core.a from the shared core archive cache.
+
+        The cached archive is hardlinked into the build directory, falling back
+        to a copy when the cache lives on another filesystem, and touched so
+        pruning keeps recently used archives.
+
+        Args:
+            core_key: Core archive key from ConfigurableCompiler.get_core_archive_key()
+            build_dir: Build directory
+            verbose: Whether to print verbose output
+
+        Returns:
+            Path to the restored core.a, or None on a cache miss
+        """
+        cached = self.cache.core_archive_cache_dir / f"{core_key}.a"
+        core_archive = build_dir / "core.a"
+        try:
+            if core_archive.exists():
+                core_archive.unlink()
+            try:
+                os.link(cached, core_archive)
+            except FileNotFoundError:
+                return None
+            except OSError:
+                shutil.copy2(cached, core_archive)
+            os.utime(cached)
+        except KeyboardInterrupt as ke:
+            from fbuild.interrupt_utils import handle_keyboard_interrupt_properly
+            handle_keyboard_interrupt_properly(ke)
+            raise  # Never reached, but satisfies type checker
+        except Exception as e:
+            if verbose:
+                print(f"      Warning: Could not restore cached core archive: {e}")
+            return None
+
+        if verbose:
+            print(f"      Reused cached core archive {core_key[:12]}")
+        return core_archive
+
+    def _store_core_archive(
+        self,
+        core_key: str,
+        compiler: ConfigurableCompiler,
+        object_files: List[Path],
+        verbose: bool
+    ) -> None:
+        """
+        Store the core objects in the shared core archive cache.
+
+        The archive is written under a temporary name and moved into place with
+        os.replace, so concurrent builds never see a partial archive. A JSON
+        sidecar records the flags the archive was built with. The cache is then
+        pruned to the most recently used archives.
+
+        Args:
+            core_key: Core archive key from ConfigurableCompiler.get_core_archive_key()
+            compiler: Configured compiler instance
+            object_files: Core object files, including the Bluetooth stub
+            verbose: Whether to print verbose output
+        """
+        cache_dir = self.cache.core_archive_cache_dir
+        cached = cache_dir / f"{core_key}.a"
+        tmp_archive = cache_dir / f"{core_key}.{os.getpid()}.tmp.a"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            compiler.export_core_archive(object_files, tmp_archive)
+            cached.with_suffix(".json").write_text(json.dumps({
+                "board": compiler.board_id,
+                "flags": compiler.get_compile_flags(),
+            }, indent=2, sort_keys=True))
+            os.replace(tmp_archive, cached)
+            self._prune_core_archive_cache()
+        except KeyboardInterrupt as ke:
+            from fbuild.interrupt_utils import handle_keyboard_interrupt_properly
+            handle_keyboard_interrupt_properly(ke)
+            raise  # Never reached, but satisfies type checker
+        except Exception as e:
+            if verbose:
+                print(f"      Warning: Could not cache core archive: {e}")
+        finally:
+            tmp_archive.unlink(missing_ok=True)
+            tmp_archive.with_name(f"{tmp_archive.name}.rsp").unlink(missing_ok=True)
+
+    def _prune_core_archive_cache(self) -> None:
+        """Remove the least recently used core archives beyond the cap."""
+        try:
+            with os.scandir(self.cache.core_archive_cache_dir) as it:
+                # Skip archives another build is still writing
+                entries = [
+                    (e.stat().st_mtime_ns, Path(e.path))
+                    for e in it
+                    if e.name.endswith(".a") and ".tmp." not in e.name
+                ]
+        except OSError:
+            return
+        entries.sort(reverse=True)
+        for _, path in entries[_CORE_ARCHIVE_CACHE_MAX_ENTRIES:]:
+            for stale in (path, path.with_suffix(".json")):
+                try:
+                    stale.unlink(missing_ok=True)
+                except OSError:
+                    pass
+
     def _create_bt_stub(
         self,
         build_dir: Path,
@@ -593,33 +763,25 @@ __attribute__((weak)) bool btInUse(void) {
                 print(f"Warning: Failed to create Bluetooth stub: {e}")
             return None
 
-    def _generate_boot_components(
+    def _generate_bootloader(
         self,
         linker: ConfigurableLinker,
-        mcu: str,
         verbose: bool
-    ) -> tuple[Optional[Path], Optional[Path]]:
+    ) -> Optional[Path]:
         """
-        Generate bootloader and partition table for ESP32.
+        Generate bootloader for ESP32.
 
         Args:
             linker: Configured linker instance
-            mcu: MCU identifier
             verbose: Verbose output mode
 
         Returns:
-            Tuple of (bootloader_bin, partitions_bin)
+            Path to bootloader.bin, or None if it could not be generated
         """
-        bootloader_bin = None
-        partitions_bin = None
-
-        if not mcu.startswith("esp32"):
-            return bootloader_bin, partitions_bin
-
         if verbose:
             print("[11/12] Generating bootloader...")
         try:
-            bootloader_bin = linker.generate_bootloader()
+            return linker.generate_bootloader()
         except KeyboardInterrupt as ke:
             from fbuild.interrupt_utils import handle_keyboard_interrupt_properly
             handle_keyboard_interrupt_properly(ke)
@@ -627,11 +789,27 @@ __attribute__((weak)) bool btInUse(void) {
         except Exception as e:
             if verbose:
                 print(f"Warning: Could not generate bootloader: {e}")
+            return None
+
+    def _generate_partition_table(
+        self,
+        linker: ConfigurableLinker,
+        verbose: bool
+    ) -> Optional[Path]:
+        """
+        Generate partition table for ESP32.
+
+        Args:
+            linker: Configured linker instance
+            verbose: Verbose output mode
 
+        Returns:
+            Path to partitions.bin, or None if it could not be generated
+        """
         if verbose:
             print("[12/12] Generating partition table...")
         try:
-            partitions_bin = linker.generate_partition_table()
+            return linker.generate_partition_table()
         except KeyboardInterrupt as ke:
             from fbuild.interrupt_utils import handle_keyboard_interrupt_properly
             handle_keyboard_interrupt_properly(ke)
@@ -639,8 +817,7 @@ __attribute__((weak)) bool btInUse(void) {
         except Exception as e:
             if verbose:
                 print(f"Warning: Could not generate partition table: {e}")
-
-        return bootloader_bin, partitions_bin
+            return None
 
     def _print_success(
         self,
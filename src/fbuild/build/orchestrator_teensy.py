@@ -6,6 +6,7 @@ providing cleaner separation of concerns and better maintainability.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 from dataclasses import dataclass
@@ -20,7 +21,7 @@ from .configurable_compiler import ConfigurableCompiler
 from .configurable_linker import ConfigurableLinker
 from .linker import SizeInfo
 from .orchestrator import IBuildOrchestrator, BuildResult
-from .build_utils import safe_rmtree
+from .build_utils import discard_tree
 
 
 @dataclass
@@ -205,7 +206,8 @@ class OrchestratorTeensy(IBuildOrchestrator):
                 build_dir,
                 platform_config=None,
                 show_progress=verbose,
-                user_build_flags=build_flags
+                user_build_flags=build_flags,
+                project_dir=project_dir
             )
 
             # Compile Arduino core
@@ -253,10 +255,12 @@ class OrchestratorTeensy(IBuildOrchestrator):
             if verbose:
                 print("[7/7] Generating firmware hex...")
 
-            firmware_hex = linker.generate_hex(firmware_elf)
-
-            # Get size info
-            size_info = linker.get_size_info(firmware_elf)
+            # The size report only reads firmware.elf, so it runs alongside
+            # the objcopy conversion
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                size_future = executor.submit(linker.get_size_info, firmware_elf)
+                firmware_hex = linker.generate_hex(firmware_elf)
+                size_info = size_future.result()
 
             build_time = time.time() - start_time
 
@@ -308,7 +312,7 @@ class OrchestratorTeensy(IBuildOrchestrator):
         if clean and build_dir.exists():
             if verbose:
                 print("[1/7] Cleaning build directory...")
-            safe_rmtree(build_dir)
+            discard_tree(build_dir)
 
         build_dir.mkdir(parents=True, exist_ok=True)
         return build_dir
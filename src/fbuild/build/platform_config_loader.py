@@ -0,0 +1,64 @@
+"""Platform Configuration Loader.
+
+This module loads the per-MCU platform configuration JSON files used by the
+configurable compiler and linker.
+
+Design:
+    - Reads config files as bytes and parses them in one call
+    - Uses orjson when it is installed, falling back to the stdlib json module
+    - Caches parsed configs per process, keyed by path and modification time,
+      so the compiler and linker for the same MCU parse the file only once
+    - Returned configs are shared between callers, so the top level is a
+      read-only mapping; nested values must not be mutated either
+"""
+
+import functools
+import json
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def get_default_config_path(mcu: str) -> Path:
+    """Get the path of the bundled platform config for an MCU.
+
+    Args:
+        mcu: MCU type (e.g., "esp32c6", "imxrt1062")
+
+    Returns:
+        Path to platform_configs/{mcu}.json
+    """
+    return Path(__file__).parent.parent / "platform_configs" / f"{mcu}.json"
+
+
+def load_platform_config(config_path: Path) -> Mapping[str, Any]:
+    """Load a platform configuration JSON file.
+
+    Args:
+        config_path: Path to platform config JSON file
+
+    Returns:
+        Read-only view of the parsed platform configuration (shared)
+    """
+    config_path = Path(config_path)
+    return _load_cached(str(config_path), config_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(config_path: str, mtime_ns: int) -> Mapping[str, Any]:
+    """Parse a platform config file, memoized by path and modification time.
+
+    Args:
+        config_path: Path to platform config JSON file
+        mtime_ns: Modification time of the file, so edits invalidate the entry
+
+    Returns:
+        Read-only view of the parsed platform configuration
+    """
+    return MappingProxyType(_json_loads(Path(config_path).read_bytes()))
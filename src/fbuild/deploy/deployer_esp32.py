@@ -10,6 +10,7 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+from fbuild.build.binary_generator import normalize_flash_freq
 from fbuild.config import PlatformIOConfig
 from fbuild.packages import Cache
 
@@ -147,14 +148,7 @@ class ESP32Deployer(IDeployer):
         flash_mode = board_json.get("build", {}).get("flash_mode", "dio")
 
         # Get flash frequency and convert to esptool format
-        f_flash = board_json.get("build", {}).get("f_flash", "80000000L")
-        if isinstance(f_flash, str) and f_flash.endswith("L"):
-            freq_value = int(f_flash.rstrip("L"))
-            flash_freq = f"{freq_value // 1000000}m"
-        elif isinstance(f_flash, (int, float)):
-            flash_freq = f"{int(f_flash // 1000000)}m"
-        else:
-            flash_freq = "80m"
+        flash_freq = normalize_flash_freq(board_json.get("build", {}).get("f_flash", "80000000L"))
 
         flash_size = "detect"
 
@@ -101,6 +101,16 @@ class Cache:
         """Directory for downloaded libraries."""
         return self.cache_root / "libraries"
 
+    @property
+    def core_archive_cache_dir(self) -> Path:
+        """Directory for core archives shared between builds, keyed by build inputs."""
+        return self.cache_root / "core_archive_cache"
+
+    @property
+    def object_cache_dir(self) -> Path:
+        """Directory for compiled objects shared between builds, keyed by content."""
+        return self.cache_root / "obj_cache"
+
     def get_build_dir(self, env_name: str) -> Path:
         """Get build directory for a specific environment.
 
@@ -244,8 +244,7 @@ class HeaderTrampolineCache:
 
                 # Generate trampoline content
                 # Use forward slashes for portability (GCC accepts both on Windows)
-                original_abs = header_file.resolve()
-                original_str = str(original_abs).replace("\\", "/")
+                original_str = header_file.resolve().as_posix()
 
                 trampoline_content = f'#pragma once\n#include "{original_str}"\n'
 
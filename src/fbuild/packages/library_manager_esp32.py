@@ -2,13 +2,15 @@
 
 This module handles downloading and compiling external libraries for ESP32 builds.
 It uses the PlatformIO registry to resolve and download libraries, then compiles
-them with the ESP32 toolchain.
+them with the ESP32 toolchain. Missing libraries are downloaded concurrently
+before any of them is compiled.
 """
 
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from fbuild.packages.platformio_registry import (
     LibrarySpec,
@@ -16,6 +18,9 @@ from fbuild.packages.platformio_registry import (
     RegistryError,
 )
 
+# Library downloads in flight at once; downloads mostly wait on the network
+_DOWNLOAD_WORKERS = 8
+
 
 class LibraryErrorESP32(Exception):
     """Exception for ESP32 library management errors."""
@@ -173,6 +178,36 @@ class LibraryManagerESP32:
         except RegistryError as e:
             raise LibraryErrorESP32(f"Failed to download library {spec}: {e}") from e
 
+    def download_libraries(self, specs: List[LibrarySpec], show_progress: bool = True) -> List[LibraryESP32]:
+        """Download several libraries concurrently.
+
+        Each library directory is downloaded once even if several specs map
+        to it, so parallel downloads never write to the same directory.
+
+        Args:
+            specs: Library specifications
+            show_progress: Whether to show progress
+
+        Returns:
+            LibraryESP32 instances in the order of specs
+
+        Raises:
+            LibraryErrorESP32: If a download fails
+        """
+        if len(specs) <= 1:
+            return [self.download_library(spec, show_progress) for spec in specs]
+
+        unique_specs: Dict[Path, LibrarySpec] = {}
+        for spec in specs:
+            unique_specs.setdefault(self.get_library(spec).lib_dir, spec)
+
+        pool = ThreadPoolExecutor(max_workers=min(_DOWNLOAD_WORKERS, len(unique_specs)))
+        try:
+            futures = {lib_dir: pool.submit(self.download_library, spec, show_progress) for lib_dir, spec in unique_specs.items()}
+            return [futures[self.get_library(spec).lib_dir].result() for spec in specs]
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
     def needs_rebuild(self, library: LibraryESP32, compiler_flags: List[str]) -> tuple[bool, str]:
         """Check if a library needs to be rebuilt.
 
@@ -353,13 +388,11 @@ class LibraryManagerESP32:
         """
         libraries = []
 
-        for spec_str in lib_specs:
-            # Parse library specification
-            spec = LibrarySpec.parse(spec_str)
-
-            # Download library
-            library = self.download_library(spec, show_progress)
+        # Download every library up front, overlapping the network round trips
+        specs = [LibrarySpec.parse(spec_str) for spec_str in lib_specs]
+        downloaded = self.download_libraries(specs, show_progress)
 
+        for library in downloaded:
             # Check if rebuild needed
             needs_rebuild, reason = self.needs_rebuild(library, compiler_flags)
 
@@ -66,6 +66,10 @@ class PlatformESP32(IPackage):
         # Get platform path from cache
         self.platform_path = cache.get_platform_path(platform_url, self.version)
 
+        # Parsed board definitions by board ID; the compiler, linker and
+        # orchestrator all ask for the same board during a build
+        self._board_json_cache: Dict[str, Dict[str, Any]] = {}
+
     @staticmethod
     def _extract_version_from_url(url: str) -> str:
         """Extract version string from platform URL.
@@ -312,11 +316,15 @@ class PlatformESP32(IPackage):
             board_id: Board identifier (e.g., "esp32-c6-devkitm-1")
 
         Returns:
-            Dictionary containing board configuration
+            Dictionary containing board configuration (shared, treat as read-only)
 
         Raises:
             PlatformErrorESP32: If board JSON doesn't exist or is invalid
         """
+        cached = self._board_json_cache.get(board_id)
+        if cached is not None:
+            return cached
+
         board_json_path = self.get_boards_dir() / f"{board_id}.json"
 
         if not board_json_path.exists():
@@ -324,7 +332,7 @@ class PlatformESP32(IPackage):
 
         try:
             with open(board_json_path, "r") as f:
-                return json.load(f)
+                board_json = json.load(f)
         except json.JSONDecodeError as e:
             raise PlatformErrorESP32(f"Failed to parse board JSON: {e}")
         except KeyboardInterrupt as ke:
@@ -335,6 +343,9 @@ class PlatformESP32(IPackage):
         except Exception as e:
             raise PlatformErrorESP32(f"Failed to read board JSON: {e}")
 
+        self._board_json_cache[board_id] = board_json
+        return board_json
+
     def list_boards(self) -> list[str]:
         """List all available board IDs.
 
@@ -4,6 +4,7 @@ This module provides utilities for discovering and managing ESP-IDF SDK paths,
 including include directories and precompiled libraries.
 """
 
+import os
 from pathlib import Path
 from typing import List
 
@@ -197,26 +198,35 @@ class SDKPathResolver:
         # Resolve MCU with fallback if needed
         resolved_mcu = self._resolve_mcu(mcu)
 
-        libs = []
-
         # Get main SDK libraries
-        sdk_lib_dir = self.sdk_base_dir / resolved_mcu / "lib"
-        if sdk_lib_dir.exists():
-            libs.extend(sdk_lib_dir.glob("*.a"))
+        libs = self._list_archives(self.sdk_base_dir / resolved_mcu / "lib")
 
         # Get flash mode-specific libraries (qio_qspi or dio_qspi)
         # For ESP32-C6: Only libspi_flash.a
         # For ESP32-S3: Multiple libraries including libfreertos.a, libesp_system.a, etc.
-        flash_lib_dir = self.sdk_base_dir / resolved_mcu / f"{flash_mode}_qspi"
-        if flash_lib_dir.exists():
-            # Collect ALL .a libraries from flash mode directory
-            # ESP32-S3 has: libfreertos.a, libspi_flash.a, libesp_system.a,
-            #               libesp_hw_support.a, libesp_psram.a, libbootloader_support.a
-            flash_libs = list(flash_lib_dir.glob("*.a"))
-            libs.extend(flash_libs)
+        # Collect ALL .a libraries from flash mode directory
+        # ESP32-S3 has: libfreertos.a, libspi_flash.a, libesp_system.a,
+        #               libesp_hw_support.a, libesp_psram.a, libbootloader_support.a
+        libs.extend(self._list_archives(self.sdk_base_dir / resolved_mcu / f"{flash_mode}_qspi"))
 
         return libs
 
+    @staticmethod
+    def _list_archives(directory: Path) -> List[Path]:
+        """List the .a archives in a directory with a single directory scan.
+
+        Args:
+            directory: Directory to scan
+
+        Returns:
+            List of .a file paths (empty if the directory does not exist)
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return [directory / entry.name for entry in entries if entry.name.endswith(".a") and not entry.name.startswith(".")]
+        except FileNotFoundError:
+            return []
+
     def get_sdk_flags_dir(self, mcu: str) -> Path:
         """Get path to SDK flags directory for a specific MCU.
 
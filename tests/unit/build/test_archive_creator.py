@@ -0,0 +1,29 @@
+"""
+Unit tests for ArchiveCreator class.
+
+Tests archive creation through ar response files.
+"""
+
+import shutil
+import subprocess
+import pytest
+from pathlib import Path
+from fbuild.build.archive_creator import ArchiveCreator
+
+
+class TestArchiveCreator:
+    """Test suite for ArchiveCreator class."""
+
+    @pytest.mark.skipif(shutil.which('ar') is None, reason='requires ar')
+    def test_create_archive_quoted_paths(self, tmp_path):
+        """Test object paths with spaces, apostrophes and quotes are archived."""
+        obj_dir = tmp_path / "o'brien \"x\""
+        obj_dir.mkdir()
+        objs = [obj_dir / 'a.o', obj_dir / 'b c.o']
+        for obj in objs:
+            obj.write_bytes(b'obj')
+
+        ar_path = Path(shutil.which('ar') or 'ar')
+        archive = ArchiveCreator(show_progress=False).create_archive(ar_path, tmp_path / 'lib.a', objs)
+        members = subprocess.run([str(ar_path), 't', str(archive)], capture_output=True, text=True, check=True)
+        assert members.stdout.split('\n')[:2] == ['a.o', 'b c.o']
@@ -0,0 +1,104 @@
+"""
+Unit tests for BinaryGenerator class.
+
+Tests flash parameter handling for ESP32 image generation.
+"""
+
+import sys
+import types
+from pathlib import Path
+from fbuild.build.binary_generator import BinaryGenerator, normalize_flash_freq
+
+
+class TestBinaryGenerator:
+    """Test suite for BinaryGenerator class."""
+
+    def test_flash_defaults(self, tmp_path):
+        """Test flash parameters default when the board omits them."""
+        generator = BinaryGenerator('esp32c6', {'build': {}}, tmp_path)
+        assert generator.flash_mode == 'dio'
+        assert generator.flash_freq == '80m'
+        assert generator.flash_size == '4MB'
+        assert generator.is_esp32
+
+    def test_flash_freq_normalized(self, tmp_path):
+        """Test flash frequency in Hz is converted to esptool format."""
+        board_config = {'build': {'flash_mode': 'qio', 'f_flash': '40000000L', 'flash_size': '8MB'}}
+        generator = BinaryGenerator('esp32s3', board_config, tmp_path)
+        assert generator.flash_mode == 'qio'
+        assert generator.flash_freq == '40m'
+        assert generator.flash_size == '8MB'
+        assert BinaryGenerator('esp32', {'build': {'f_flash': 80000000}}, tmp_path).flash_freq == '80m'
+
+    def test_run_esptool_in_process(self, monkeypatch):
+        """Test esptool runs in-process with its output captured."""
+        calls = []
+
+        def main(argv):
+            calls.append(argv)
+            print('Successfully created esp32 image.')
+
+        monkeypatch.setitem(sys.modules, 'esptool', types.SimpleNamespace(main=main))
+        result = BinaryGenerator._run_esptool(['--chip', 'esp32', 'version'], timeout=10)
+        assert calls == [['--chip', 'esp32', 'version']]
+        assert result.returncode == 0
+        assert b'Successfully created' in result.stdout
+
+    def test_run_esptool_leaves_other_threads_output(self, monkeypatch, capsys):
+        """Test output printed by other threads during esptool is not captured."""
+        import threading
+
+        started = threading.Event()
+        other_printed = threading.Event()
+
+        def main(argv):
+            started.set()
+            other_printed.wait(5)
+            print('esptool output')
+
+        def other_thread():
+            started.wait(5)
+            print('[12/12] Generating partition table...')
+            other_printed.set()
+
+        monkeypatch.setitem(sys.modules, 'esptool', types.SimpleNamespace(main=main))
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        result = BinaryGenerator._run_esptool([], timeout=10)
+        thread.join()
+        assert result.stdout == b'esptool output\n'
+        assert capsys.readouterr().out == '[12/12] Generating partition table...\n'
+
+    def test_run_esptool_failure(self, monkeypatch):
+        """Test esptool exits and exceptions become non-zero return codes."""
+        def exit_main(argv):
+            sys.exit(2)
+
+        def raise_main(argv):
+            raise RuntimeError('bad elf')
+
+        monkeypatch.setitem(sys.modules, 'esptool', types.SimpleNamespace(main=exit_main))
+        assert BinaryGenerator._run_esptool([], timeout=10).returncode == 2
+
+        monkeypatch.setitem(sys.modules, 'esptool', types.SimpleNamespace(main=raise_main))
+        result = BinaryGenerator._run_esptool([], timeout=10)
+        assert result.returncode == 1
+        assert b'bad elf' in result.stderr
+
+    def test_elf2image_args(self, tmp_path):
+        """Test elf2image arguments carry chip and flash settings."""
+        generator = BinaryGenerator('esp32c6', {'build': {'flash_mode': 'qio'}}, tmp_path)
+        args = generator._elf2image_args(Path('fw.elf'), Path('fw.bin'), 'dio', elf_sha256_offset='0xb0')
+        assert args == [
+            '--chip', 'esp32c6', 'elf2image',
+            '--flash-mode', 'dio', '--flash-freq', '80m', '--flash-size', '4MB',
+            '--elf-sha256-offset', '0xb0',
+            '-o', 'fw.bin', 'fw.elf',
+        ]
+        assert '--elf-sha256-offset' not in generator._elf2image_args(Path('b.elf'), Path('b.bin'), 'qio')
+
+    def test_normalize_flash_freq(self):
+        """Test frequency formats accepted from board definitions."""
+        assert normalize_flash_freq('80000000L') == '80m'
+        assert normalize_flash_freq(40000000) == '40m'
+        assert normalize_flash_freq('40m') == '40m'
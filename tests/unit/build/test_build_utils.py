@@ -0,0 +1,63 @@
+"""
+Unit tests for build utilities.
+
+Tests background removal of build directories.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import pytest
+from fbuild.build.build_utils import discard_tree
+
+
+def _join_discard_threads():
+    """Wait for background discard threads to finish."""
+    for thread in threading.enumerate():
+        if thread.name.startswith('discard-'):
+            thread.join()
+
+
+class TestDiscardTree:
+    """Test suite for discard_tree."""
+
+    def test_discard_tree(self, tmp_path):
+        """Test the directory is freed at once and removed in the background."""
+        build_dir = tmp_path / 'build'
+        (build_dir / 'obj').mkdir(parents=True)
+        (build_dir / 'obj' / 'a.o').write_text('obj')
+
+        discard_tree(build_dir)
+        assert not build_dir.exists()
+        build_dir.mkdir()
+
+        _join_discard_threads()
+        assert [p.name for p in tmp_path.iterdir()] == ['build']
+
+    def test_discard_tree_keeps_own_pending_trash(self, tmp_path):
+        """Test trees this process is still removing are left to their thread."""
+        (tmp_path / 'build').mkdir()
+        pending = tmp_path / f'.build.rm.{os.getpid()}.1'
+        pending.mkdir()
+
+        discard_tree(tmp_path / 'build')
+        _join_discard_threads()
+        assert [p.name for p in tmp_path.iterdir()] == [pending.name]
+
+    def test_discard_tree_sweeps_abandoned_trash(self, tmp_path):
+        """Test leftovers from a process that exited are removed."""
+        pytest.importorskip('psutil')
+        exited = subprocess.Popen([sys.executable, '-c', ''])
+        exited.wait()
+        (tmp_path / 'build').mkdir()
+        (tmp_path / f'.build.rm.{exited.pid}.1').mkdir()
+
+        discard_tree(tmp_path / 'build')
+        _join_discard_threads()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_discard_missing_tree(self, tmp_path):
+        """Test discarding a missing directory does nothing."""
+        discard_tree(tmp_path / 'missing')
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,57 @@
+"""
+Unit tests for CompilationExecutor class.
+
+Tests command assembly and dependency file parsing.
+"""
+
+import shutil
+import pytest
+from pathlib import Path
+from fbuild.build.compilation_executor import CompilationExecutor
+
+
+class TestCompilationExecutor:
+    """Test suite for CompilationExecutor class."""
+
+    @pytest.fixture
+    def executor(self, tmp_path, monkeypatch):
+        """Create executor without a compiler cache wrapper."""
+        monkeypatch.setenv('FBUILD_NO_COMPILER_CACHE', '1')
+        return CompilationExecutor(tmp_path / 'build', show_progress=False, use_trampolines=False)
+
+    def test_command_prefix(self, executor, tmp_path):
+        """Test prefix contains compiler, flags and the include response file."""
+        prefix = executor._get_command_prefix(Path('/bin/gcc'), ('-Os',), [Path('/inc/a')])
+        response_file = tmp_path / 'build' / 'includes.rsp'
+        assert prefix == (str(Path('/bin/gcc')), '-Os', f'@{response_file}')
+        assert response_file.read_text() == '-I/inc/a'
+
+    def test_command_prefix_reused(self, executor):
+        """Test prefix is reused until the include paths change."""
+        includes = [Path('/inc/a')]
+        prefix = executor._get_command_prefix(Path('/bin/gcc'), ('-Os',), includes)
+        assert executor._get_command_prefix(Path('/bin/gcc'), ('-Os',), includes) is prefix
+
+        includes.append(Path('/inc/b'))
+        executor._get_command_prefix(Path('/bin/gcc'), ('-Os',), includes)
+        assert (executor.build_dir / 'includes.rsp').read_text() == '-I/inc/a\n-I/inc/b'
+
+    def test_read_dependencies(self, tmp_path):
+        """Test prerequisites are parsed across continuation lines."""
+        dep_file = tmp_path / 'a.o.d'
+        dep_file.write_text('a.o: src/a.c \\\n inc\\ dir/a.h b.h\n')
+        assert CompilationExecutor.read_dependencies(dep_file) == [
+            Path('src/a.c'), Path('inc dir/a.h'), Path('b.h')
+        ]
+
+    def test_ccache_environment(self, tmp_path, monkeypatch):
+        """Test ccache gets content-based compiler checks unless the user set one."""
+        monkeypatch.delenv('FBUILD_NO_COMPILER_CACHE', raising=False)
+        monkeypatch.setenv('CCACHE_COMPILERCHECK', 'mtime')
+        monkeypatch.delenv('CCACHE_SLOPPINESS', raising=False)
+        monkeypatch.setattr(shutil, 'which', lambda name: '/usr/bin/ccache' if name == 'ccache' else None)
+        monkeypatch.setattr(Path, 'exists', lambda self: False)
+        executor = CompilationExecutor(tmp_path / 'build', show_progress=False, use_trampolines=False)
+        assert executor.ccache_path == Path('/usr/bin/ccache')
+        assert executor._subprocess_env['CCACHE_COMPILERCHECK'] == 'mtime'
+        assert 'time_macros' in executor._subprocess_env['CCACHE_SLOPPINESS']
@@ -0,0 +1,270 @@
+"""
+Unit tests for ConfigurableCompiler class.
+
+Tests the configuration-driven compiler used for ESP32 and Teensy builds.
+"""
+
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+from fbuild.build.configurable_compiler import ConfigurableCompiler
+
+
+class TestConfigurableCompiler:
+    """Test suite for ConfigurableCompiler class."""
+
+    @pytest.fixture
+    def platform(self):
+        """Create mock platform with a board definition."""
+        platform = Mock()
+        platform.get_board_json.return_value = {
+            'build': {'mcu': 'esp32c6', 'variant': 'esp32c6', 'core': 'esp32'}
+        }
+        return platform
+
+    @pytest.fixture
+    def toolchain(self, tmp_path):
+        """Create mock toolchain with gcc/g++/ar paths."""
+        toolchain = Mock()
+        toolchain.get_gcc_path.return_value = tmp_path / 'bin' / 'gcc'
+        toolchain.get_gxx_path.return_value = tmp_path / 'bin' / 'g++'
+        toolchain.get_ar_path.return_value = tmp_path / 'bin' / 'ar'
+        return toolchain
+
+    @pytest.fixture
+    def framework(self, tmp_path):
+        """Create mock framework exposing core and variant directories."""
+        framework = Mock(spec=['get_core_dir', 'get_variant_dir', 'get_core_sources'])
+        framework.get_core_dir.return_value = tmp_path / 'core'
+        framework.get_variant_dir.return_value = tmp_path / 'variant'
+        return framework
+
+    @pytest.fixture
+    def compiler(self, platform, toolchain, framework, tmp_path):
+        """Create compiler with an inline platform config."""
+        config = {
+            'compiler_flags': {'common': ['-Os'], 'c': ['-std=gnu17'], 'cxx': ['-std=gnu++2b']},
+            'defines': [],
+        }
+        return ConfigurableCompiler(
+            platform,
+            toolchain,
+            framework,
+            'esp32-c6-devkitm-1',
+            tmp_path / 'build',
+            platform_config=config,
+            show_progress=False,
+        )
+
+    def test_board_fields(self, compiler):
+        """Test MCU, variant and core are read from the board definition."""
+        assert compiler.mcu == 'esp32c6'
+        assert compiler.variant == 'esp32c6'
+        assert compiler.core == 'esp32'
+
+    def test_toolchain_paths_resolved_once(self, compiler, toolchain):
+        """Test toolchain binaries are resolved at construction only."""
+        compiler.get_compiler_info()
+        compiler.get_compiler_info()
+        assert toolchain.get_gcc_path.call_count == 1
+        assert toolchain.get_gxx_path.call_count == 1
+        assert toolchain.get_ar_path.call_count == 1
+
+    def test_include_paths(self, compiler, tmp_path):
+        """Test core and variant include paths."""
+        assert compiler.get_include_paths() == [tmp_path / 'core', tmp_path / 'variant']
+
+    def test_library_includes_added_before_first_lookup(self, compiler, tmp_path):
+        """Test library includes registered before the first lookup are kept."""
+        compiler.add_library_includes([Path('/lib/a')])
+        includes = compiler.get_include_paths()
+        assert includes[-1] == Path('/lib/a')
+        assert includes[:2] == [tmp_path / 'core', tmp_path / 'variant']
+
+    def test_library_includes_added_after_lookup(self, compiler):
+        """Test library includes registered after a lookup are merged once."""
+        compiler.get_include_paths()
+        compiler.add_library_includes([Path('/lib/a')])
+        compiler.add_library_includes([Path('/lib/b')])
+        includes = compiler.get_include_paths()
+        assert includes[-2:] == [Path('/lib/a'), Path('/lib/b')]
+        assert compiler.get_include_paths() == includes
+
+    def test_needs_rebuild_without_dependency_file(self, compiler, tmp_path):
+        """Test objects without a dependency file are rebuilt."""
+        source = tmp_path / 'a.c'
+        source.write_text('int a;')
+        obj = tmp_path / 'a.o'
+        obj.write_text('obj')
+        assert compiler.needs_rebuild(source, obj)
+
+    def test_needs_rebuild_tracks_headers(self, compiler, tmp_path):
+        """Test header changes listed in the dependency file trigger a rebuild."""
+        source = tmp_path / 'a.c'
+        header = tmp_path / 'inc dir' / 'a.h'
+        header.parent.mkdir()
+        source.write_text('#include "a.h"')
+        header.write_text('#define A 1')
+        obj = tmp_path / 'a.o'
+        obj.write_text('obj')
+        dep = tmp_path / 'a.o.d'
+        dep.write_text(f'{obj}: {source} \\\n {str(header).replace(" ", chr(92) + " ")}\n')
+
+        os.utime(source, (1000, 1000))
+        os.utime(header, (1000, 1000))
+        os.utime(obj, (2000, 2000))
+        assert not compiler.needs_rebuild(source, obj)
+
+        os.utime(header, (3000, 3000))
+        assert compiler.needs_rebuild(source, obj)
+
+        header.unlink()
+        assert compiler.needs_rebuild(source, obj)
+
+    def test_language_flags_cached(self, compiler):
+        """Test per-language flags are built once and shared."""
+        cxx_flags = compiler._get_language_flags(True)
+        assert cxx_flags[0] == '-Os'
+        assert cxx_flags[-1] == '-std=gnu++2b'
+        assert '-std=gnu17' not in cxx_flags
+        assert compiler._get_language_flags(True) is cxx_flags
+        assert compiler._get_language_flags(False)[-1] == '-std=gnu17'
+
+    def test_object_path_unique_per_source(self, compiler, tmp_path):
+        """Test same-stem sources map to distinct, stable object paths."""
+        obj_dir = tmp_path / 'obj'
+        c_obj = compiler.get_object_path(Path('/core/Print.c'), obj_dir)
+        cpp_obj = compiler.get_object_path(Path('/core/Print.cpp'), obj_dir)
+        assert c_obj != cpp_obj
+        assert c_obj.parent == obj_dir
+        assert c_obj.name.startswith('Print-') and c_obj.suffix == '.o'
+        assert compiler.get_object_path(Path('/core/Print.c'), obj_dir) == c_obj
+
+    def test_compile_core_parallel_keeps_source_order(self, compiler, framework, tmp_path, monkeypatch):
+        """Test core objects come back in source order and failures are skipped."""
+        from fbuild.build.configurable_compiler import ConfigurableCompilerError
+
+        sources = [tmp_path / 'core' / f'{name}.cpp' for name in ('a', 'b', 'c', 'd')]
+        framework.get_core_sources.return_value = sources
+
+        def fake_compile(source, output_path, use_object_cache):
+            assert use_object_cache
+            if source.stem == 'c':
+                raise ConfigurableCompilerError('boom')
+            return output_path
+
+        monkeypatch.setattr(compiler, '_compile_source', fake_compile)
+        objects = compiler.compile_core()
+        obj_dir = tmp_path / 'build' / 'obj' / 'core'
+        assert objects == [compiler.get_object_path(s, obj_dir) for s in sources if s.stem != 'c']
+
+    def test_core_archive_key_tracks_sources(self, compiler, framework, tmp_path):
+        """Test the core archive key is stable and changes when a core source changes."""
+        source = tmp_path / 'core' / 'a.cpp'
+        source.parent.mkdir()
+        source.write_text('int a;')
+        os.utime(source, (1000, 1000))
+        framework.get_core_sources.return_value = [source]
+
+        key = compiler.get_core_archive_key()
+        assert compiler.get_core_archive_key() == key
+
+        os.utime(source, (2000, 2000))
+        assert compiler.get_core_archive_key() != key
+        assert framework.get_core_sources.call_count == 1
+
+    def test_object_cache_shares_objects(self, platform, toolchain, framework, tmp_path, monkeypatch):
+        """Test identical preprocessed sources reuse one cached object."""
+        monkeypatch.setenv('FBUILD_NO_COMPILER_CACHE', '1')
+        compiler = ConfigurableCompiler(
+            platform,
+            toolchain,
+            framework,
+            'esp32-c6-devkitm-1',
+            tmp_path / 'build',
+            platform_config={'compiler_flags': {'common': [], 'c': [], 'cxx': []}, 'defines': []},
+            show_progress=False,
+            object_cache_dir=tmp_path / 'obj_cache',
+        )
+        source = tmp_path / 'a.c'
+        source.write_text('int a;')
+        toolchain.get_gcc_path.return_value.parent.mkdir()
+        toolchain.get_gcc_path.return_value.write_text('')
+
+        compiled = []
+
+        def fake_compile(compiler_path, source_path, output_path, compile_flags, include_paths):
+            compiled.append(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(b'obj')
+            compiler.compilation_executor.get_dependency_file(output_path).write_text(f'{output_path}: {source_path}\n')
+            return output_path
+
+        executor = compiler.compilation_executor
+        monkeypatch.setattr(executor, 'hash_preprocessed', lambda *args: 'ab' * 32)
+        monkeypatch.setattr(executor, 'compile_source', fake_compile)
+
+        first = compiler._compile_source(source, tmp_path / 'env1' / 'a.o', True)
+        second = compiler._compile_source(source, tmp_path / 'env2' / 'a.o', True)
+        assert compiled == [first]
+        assert second.read_bytes() == b'obj'
+        assert (tmp_path / 'obj_cache' / 'ab' / f"{'ab' * 32}.o").exists()
+        assert not compiler.needs_rebuild(source, second)
+
+        # Project sources are never shared, so they skip the cache entirely
+        monkeypatch.setattr(executor, 'hash_preprocessed', Mock(side_effect=AssertionError))
+        sketch = tmp_path / 'sketch.ino.cpp'
+        sketch.write_text('int b;')
+        assert compiler.compile_source(sketch, tmp_path / 'env1' / 'sketch.o') == compiled[-1]
+        assert len(list((tmp_path / 'obj_cache').rglob('*.o'))) == 1
+
+    def test_object_cache_incomplete_entry_recompiles(self, platform, toolchain, framework, tmp_path, monkeypatch):
+        """Test a cached object without its dependency file is treated as a miss."""
+        monkeypatch.setenv('FBUILD_NO_COMPILER_CACHE', '1')
+        compiler = ConfigurableCompiler(
+            platform,
+            toolchain,
+            framework,
+            'esp32-c6-devkitm-1',
+            tmp_path / 'build',
+            platform_config={'compiler_flags': {'common': [], 'c': [], 'cxx': []}, 'defines': []},
+            show_progress=False,
+            object_cache_dir=tmp_path / 'obj_cache',
+        )
+        source = tmp_path / 'a.c'
+        source.write_text('int a;')
+        cached = tmp_path / 'obj_cache' / 'ab' / f"{'ab' * 32}.o"
+        cached.parent.mkdir(parents=True)
+        cached.write_bytes(b'stale')
+
+        compiled = []
+
+        def fake_compile(compiler_path, source_path, output_path, compile_flags, include_paths):
+            compiled.append(output_path)
+            output_path.write_bytes(b'obj')
+            compiler.compilation_executor.get_dependency_file(output_path).write_text(f'{output_path}: {source_path}\n')
+            return output_path
+
+        executor = compiler.compilation_executor
+        monkeypatch.setattr(executor, 'hash_preprocessed', lambda *args: 'ab' * 32)
+        monkeypatch.setattr(executor, 'compile_source', fake_compile)
+
+        output = compiler._compile_source(source, tmp_path / 'env' / 'a.o', True)
+        assert compiled == [output]
+        assert output.read_bytes() == b'obj'
+
+    def test_object_cache_pruned(self, tmp_path, monkeypatch):
+        """Test the object cache keeps only the most recently used objects."""
+        from fbuild.build import configurable_compiler
+
+        monkeypatch.setattr(configurable_compiler, '_OBJECT_CACHE_MAX_ENTRIES', 2)
+        shard = tmp_path / 'ab'
+        shard.mkdir()
+        for i, name in enumerate(['old', 'mid', 'new']):
+            for suffix in ('.o', '.d'):
+                (shard / f'{name}{suffix}').write_text('')
+                os.utime(shard / f'{name}{suffix}', (1000 + i, 1000 + i))
+
+        configurable_compiler._prune_object_cache(tmp_path)
+        assert sorted(p.name for p in shard.iterdir()) == ['mid.d', 'mid.o', 'new.d', 'new.o']
@@ -0,0 +1,391 @@
+"""
+Unit tests for ConfigurableLinker class.
+
+Tests the configuration-driven linker used for ESP32 and Teensy builds.
+"""
+
+import hashlib
+import io
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import pytest
+from unittest.mock import Mock
+from fbuild.build.configurable_linker import ConfigurableLinker, ConfigurableLinkerError, _hash_file, _hash_file_cached, _thin_archive_members
+
+
+def _fake_popen(commands, returncode=0, stderr=b''):
+    """Build a Popen stand-in that records commands and writes the output file."""
+    class FakePopen:
+        def __init__(self, cmd, **kwargs):
+            commands.append(cmd)
+            self.stderr = io.BytesIO(stderr)
+            if returncode == 0:
+                open(cmd[cmd.index('-o') + 1], 'w').close()
+
+        def wait(self):
+            return returncode
+
+        def poll(self):
+            return returncode
+
+        def kill(self):
+            pass
+
+    return FakePopen
+
+
+class TestConfigurableLinker:
+    """Test suite for ConfigurableLinker class."""
+
+    @pytest.fixture
+    def platform(self):
+        """Create mock platform with an ESP32-S3 board definition."""
+        platform = Mock()
+        platform.get_board_json.return_value = {
+            'build': {'mcu': 'ESP32S3', 'flash_mode': 'opi', 'psram_mode': 'opi'},
+            'upload': {'maximum_size': 3342336, 'maximum_ram_size': 327680},
+        }
+        return platform
+
+    @pytest.fixture
+    def toolchain(self, tmp_path):
+        """Create mock toolchain."""
+        toolchain = Mock()
+        toolchain.toolchain_type = 'xtensa-esp32s3-elf'
+        toolchain.get_gxx_path.return_value = tmp_path / 'bin' / 'g++'
+        toolchain.get_objcopy_path.return_value = tmp_path / 'bin' / 'objcopy'
+        return toolchain
+
+    @pytest.fixture
+    def framework(self, tmp_path):
+        """Create mock framework with a linker script."""
+        framework = Mock(spec=['get_linker_script'])
+        script = tmp_path / 'imxrt1062.ld'
+        script.write_text('')
+        framework.get_linker_script.return_value = script
+        return framework
+
+    @pytest.fixture
+    def linker(self, platform, toolchain, framework, tmp_path):
+        """Create linker with an inline platform config."""
+        config = {'linker_flags': ['-Wl,--gc-sections'], 'linker_scripts': []}
+        return ConfigurableLinker(
+            platform,
+            toolchain,
+            framework,
+            'esp32-s3-devkitc-1',
+            tmp_path / 'build',
+            platform_config=config,
+            show_progress=False,
+        )
+
+    def test_board_fields(self, linker):
+        """Test MCU and flash settings are read from the board definition."""
+        assert linker.mcu == 'esp32s3'
+        assert linker.flash_mode == 'opi'
+        assert linker.psram_mode == 'opi'
+        assert linker.flash_dir_name == 'opi_opi'
+        assert linker.max_flash == 3342336
+        assert linker.max_ram == 327680
+
+    def test_linker_flags(self, linker, tmp_path):
+        """Test config flags are followed by the map file flag."""
+        map_file = str(tmp_path / 'build' / 'firmware.map').replace('\\', '/')
+        assert linker.get_linker_flags() == ['-Wl,--gc-sections', f'-Wl,-Map={map_file}']
+
+    def test_linker_flags_cached_copy(self, linker):
+        """Test callers get independent copies of the cached flags."""
+        flags = linker.get_linker_flags()
+        flags.append('-extra')
+        assert '-extra' not in linker.get_linker_flags()
+
+    def test_linker_info_cached(self, linker, toolchain):
+        """Test linker info is computed once."""
+        info = linker.get_linker_info()
+        assert info['linker_scripts'] == ['imxrt1062.ld']
+        assert info['sdk_library_count'] == 0
+        assert linker.get_linker_info() == info
+        assert toolchain.get_gxx_path.call_count == 1
+
+    def test_sdk_mcu_dir_fallback(self, platform, toolchain, tmp_path):
+        """Test the SDK directory falls back to a compatible MCU once."""
+        platform.get_board_json.return_value = {'build': {'mcu': 'esp32c2'}}
+        sdk_dir = tmp_path / 'sdk'
+        (sdk_dir / 'esp32c3' / 'ld').mkdir(parents=True)
+        framework = Mock(spec=['get_sdk_dir'])
+        framework.get_sdk_dir.return_value = sdk_dir
+        linker = ConfigurableLinker(
+            platform, toolchain, framework, 'esp32-c2-devkitm-1', tmp_path / 'build',
+            platform_config={}, show_progress=False,
+        )
+        assert linker._get_sdk_mcu_dir() == sdk_dir / 'esp32c3'
+        assert linker._get_sdk_mcu_dir() == sdk_dir / 'esp32c3'
+        assert framework.get_sdk_dir.call_count == 1
+
+    def test_link_esp32s3_script_args(self, platform, toolchain, tmp_path, monkeypatch):
+        """Test scripts on the search path are passed by name, others by path."""
+        sdk_dir = tmp_path / 'sdk'
+        ld_dir = sdk_dir / 'esp32s3' / 'ld'
+        flash_dir = sdk_dir / 'esp32s3' / 'opi_opi'
+        ld_dir.mkdir(parents=True)
+        flash_dir.mkdir()
+        (ld_dir / 'memory.ld').write_text('')
+        (flash_dir / 'sections.ld').write_text('')
+        framework = Mock(spec=['get_sdk_dir', 'get_sdk_libs'])
+        framework.get_sdk_dir.return_value = sdk_dir
+        framework.get_sdk_libs.return_value = []
+        toolchain.get_gxx_path.return_value.parent.mkdir(parents=True)
+        toolchain.get_gxx_path.return_value.write_text('')
+        core_archive = tmp_path / 'core.a'
+        core_archive.write_text('')
+        linker = ConfigurableLinker(
+            platform, toolchain, framework, 'esp32-s3-devkitc-1', tmp_path / 'build',
+            platform_config={'linker_scripts': ['memory.ld', 'sections.ld']}, show_progress=False,
+        )
+
+        commands = []
+        (tmp_path / 'build').mkdir()
+        monkeypatch.setattr(subprocess, 'Popen', _fake_popen(commands))
+        linker.link([tmp_path / 'main.o'], core_archive, library_archives=[tmp_path / 'libuser.a'])
+        response_file = tmp_path / 'build' / 'link.rsp'
+        assert commands[0] == [
+            str(toolchain.get_gxx_path.return_value),
+            f'@{response_file}',
+            '-o',
+            os.fspath(tmp_path / 'build' / 'firmware.elf'),
+        ]
+        args = shlex.split(response_file.read_text(encoding='utf-8'))
+        assert f'-L{ld_dir}' in args
+        assert f'-L{flash_dir}' in args
+        assert args.index('-Tmemory.ld') < args.index('-Tsections.ld')
+
+        inputs = args[args.index(os.fspath(tmp_path / 'main.o')):]
+        assert inputs[:2] == [os.fspath(tmp_path / 'main.o'), os.fspath(core_archive)]
+        assert inputs[inputs.index('-Wl,--start-group') + 1] == os.fspath(tmp_path / 'libuser.a')
+        assert inputs[-5:] == ['-lgcc', '-lstdc++', '-lm', '-lc', '-Wl,--end-group']
+
+    def test_response_file_quoting(self, linker):
+        """Test response file arguments survive spaces, quotes and backslashes."""
+        args = ['/a b/main.o', 'C:\\sdk\\lib.a', '-DNAME="x"']
+        response_file = linker._write_response_file(args)
+        assert shlex.split(response_file.read_text(encoding='utf-8')) == args
+
+    def test_linker_scripts_in_config_order(self, platform, toolchain, tmp_path):
+        """Test configured scripts present in the ld directory are kept in order."""
+        platform.get_board_json.return_value = {'build': {'mcu': 'esp32c6'}}
+        ld_dir = tmp_path / 'sdk' / 'esp32c6' / 'ld'
+        ld_dir.mkdir(parents=True)
+        for name in ('memory.ld', 'sections.ld', 'unused.ld'):
+            (ld_dir / name).write_text('')
+        framework = Mock(spec=['get_sdk_dir'])
+        framework.get_sdk_dir.return_value = tmp_path / 'sdk'
+        linker = ConfigurableLinker(
+            platform, toolchain, framework, 'esp32-c6-devkitm-1', tmp_path / 'build',
+            platform_config={'linker_scripts': ['sections.ld', 'missing.ld', 'memory.ld']},
+            show_progress=False,
+        )
+        assert linker.get_linker_scripts() == [ld_dir / 'sections.ld', ld_dir / 'memory.ld']
+
+    def test_linker_script_dir_missing(self, platform, toolchain, tmp_path):
+        """Test a missing ld directory is reported."""
+        framework = Mock(spec=['get_sdk_dir'])
+        framework.get_sdk_dir.return_value = tmp_path / 'sdk'
+        linker = ConfigurableLinker(
+            platform, toolchain, framework, 'esp32-s3-devkitc-1', tmp_path / 'build',
+            platform_config={'linker_scripts': ['memory.ld']}, show_progress=False,
+        )
+        with pytest.raises(ConfigurableLinkerError, match='Linker script directory not found'):
+            linker.get_linker_scripts()
+
+    def test_sdk_libraries_shared_across_instances(self, platform, toolchain, tmp_path):
+        """Test SDK libraries are discovered once per SDK and board settings."""
+        framework = Mock(spec=['get_sdk_dir', 'get_sdk_libs'])
+        framework.get_sdk_dir.return_value = tmp_path / 'sdk'
+        framework.get_sdk_libs.return_value = [tmp_path / 'sdk' / 'libnet.a']
+        linkers = [
+            ConfigurableLinker(
+                platform, toolchain, framework, 'esp32-s3-devkitc-1', tmp_path / 'build',
+                platform_config={}, show_progress=False,
+            )
+            for _ in range(2)
+        ]
+        assert [linker.get_sdk_libraries() for linker in linkers] == [[tmp_path / 'sdk' / 'libnet.a']] * 2
+        framework.get_sdk_libs.assert_called_once_with('esp32s3', 'opi')
+
+    def test_link_failure_reports_output_tail(self, linker, toolchain, tmp_path, monkeypatch):
+        """Test linker diagnostics are streamed into the error report."""
+        toolchain.get_gxx_path.return_value.parent.mkdir(parents=True)
+        toolchain.get_gxx_path.return_value.write_text('')
+        core_archive = tmp_path / 'core.a'
+        core_archive.write_text('')
+        stderr = b'main.o: undefined reference to `setup\'\ncollect2: error\n'
+        monkeypatch.setattr(subprocess, 'Popen', _fake_popen([], returncode=1, stderr=stderr))
+        with pytest.raises(ConfigurableLinkerError, match='undefined reference to `setup'):
+            linker.link([tmp_path / 'main.o'], core_archive)
+
+    def test_link_reuses_cached_output(self, linker, toolchain, tmp_path, monkeypatch):
+        """Test unchanged link inputs reuse the cached firmware.elf."""
+        toolchain.get_gxx_path.return_value.parent.mkdir(parents=True)
+        toolchain.get_gxx_path.return_value.write_text('')
+        core_archive = tmp_path / 'core.a'
+        core_archive.write_text('core')
+        main_obj = tmp_path / 'main.o'
+        main_obj.write_text('v1')
+        commands = []
+        monkeypatch.setattr(subprocess, 'Popen', _fake_popen(commands))
+
+        output_elf = linker.link([main_obj], core_archive)
+        output_elf.unlink()
+        assert linker.link([main_obj], core_archive) == output_elf
+        assert output_elf.exists()
+        assert len(commands) == 1
+
+        main_obj.write_text('v2')
+        os.utime(main_obj, ns=(main_obj.stat().st_atime_ns, main_obj.stat().st_mtime_ns + 1_000_000))
+        linker.link([main_obj], core_archive)
+        assert len(commands) == 2
+
+    def test_link_skipped_when_up_to_date(self, linker, toolchain, tmp_path, monkeypatch):
+        """Test an unchanged link is skipped on input sizes and timestamps alone."""
+        toolchain.get_gxx_path.return_value.parent.mkdir(parents=True)
+        toolchain.get_gxx_path.return_value.write_text('')
+        core_archive = tmp_path / 'core.a'
+        core_archive.write_text('core')
+        main_obj = tmp_path / 'main.o'
+        main_obj.write_text('v1')
+        commands = []
+        monkeypatch.setattr(subprocess, 'Popen', _fake_popen(commands))
+
+        linker.link([main_obj], core_archive)
+        shutil.rmtree(tmp_path / '.zapio_link_cache')
+        linker.link([main_obj], core_archive)
+        assert len(commands) == 1
+
+        os.utime(main_obj, (1000, 1000))
+        linker.link([main_obj], core_archive)
+        assert len(commands) == 2
+
+    @pytest.mark.skipif(shutil.which('ar') is None, reason='requires ar')
+    def test_thin_archive_members(self, tmp_path):
+        """Test thin archive members are listed, including long member names."""
+        objs = [tmp_path / 'a.o', tmp_path / 'obj' / 'a_rather_long_object_name-1234567890abcdef.o']
+        objs[1].parent.mkdir()
+        for obj in objs:
+            obj.write_bytes(b'\0' * 8)
+        archive = tmp_path / 'core.a'
+        subprocess.run(['ar', 'rcT', str(archive), *map(str, objs)], check=True)
+        assert [p.resolve() for p in _thin_archive_members(archive)] == objs
+
+        regular = tmp_path / 'lib.a'
+        subprocess.run(['ar', 'rc', str(regular), str(objs[0])], check=True)
+        assert _thin_archive_members(regular) == []
+
+    @pytest.mark.skipif(shutil.which('ar') is None, reason='requires ar')
+    def test_link_relinks_on_thin_archive_member_change(self, linker, toolchain, tmp_path, monkeypatch):
+        """Test a rebuilt core object relinks even when the thin core.a is unchanged."""
+        toolchain.get_gxx_path.return_value.parent.mkdir(parents=True)
+        toolchain.get_gxx_path.return_value.write_text('')
+        core_obj = tmp_path / 'Print.o'
+        core_obj.write_bytes(b'v1')
+        core_archive = tmp_path / 'core.a'
+        subprocess.run(['ar', 'rcT', str(core_archive), str(core_obj)], check=True)
+        main_obj = tmp_path / 'main.o'
+        main_obj.write_text('main')
+        commands = []
+        monkeypatch.setattr(subprocess, 'Popen', _fake_popen(commands))
+
+        linker.link([main_obj], core_archive)
+        archive_bytes = core_archive.read_bytes()
+        core_obj.write_bytes(b'v2')
+        os.utime(core_obj, ns=(core_obj.stat().st_atime_ns, core_obj.stat().st_mtime_ns + 1_000_000))
+        assert core_archive.read_bytes() == archive_bytes
+        linker.link([main_obj], core_archive)
+        assert len(commands) == 2
+
+    def test_link_cache_pruned(self, linker, tmp_path, monkeypatch):
+        """Test only the most recently used link cache entries are kept."""
+        import fbuild.build.configurable_linker as configurable_linker
+
+        monkeypatch.setattr(configurable_linker, '_LINK_CACHE_MAX_ENTRIES', 2)
+        output_elf = tmp_path / 'build' / 'firmware.elf'
+        output_elf.parent.mkdir()
+        output_elf.write_text('elf')
+        for i, key in enumerate(('k1', 'k2', 'k3')):
+            linker._store_cached_link(key, output_elf)
+            entry = linker._get_link_cache_entry(key)
+            os.utime(entry, (1000 + i, 1000 + i))
+        linker._prune_link_cache()
+        assert sorted(p.name for p in (tmp_path / '.zapio_link_cache').iterdir()) == ['k2', 'k3']
+
+    def test_hash_file_small_and_large(self, tmp_path):
+        """Test single-read and buffered hashing give the plain content digest."""
+        for name, size in (('small.o', 100), ('large.a', 3 * 1024 * 1024 + 7)):
+            path = tmp_path / name
+            data = bytes(range(256)) * (size // 256) + b'x' * (size % 256)
+            path.write_bytes(data)
+            assert _hash_file(path) == hashlib.blake2b(data, digest_size=16).digest()
+
+    def test_hash_file_cached(self, tmp_path, monkeypatch):
+        """Test an unchanged file is hashed once and a changed one again."""
+        from fbuild.build import configurable_linker
+
+        hashed = []
+
+        def counting_hash(path):
+            hashed.append(path)
+            return _hash_file(path)
+
+        monkeypatch.setattr(configurable_linker, '_hash_file', counting_hash)
+        path = tmp_path / 'lib.a'
+        path.write_bytes(b'one')
+        first = _hash_file_cached(path)
+        assert _hash_file_cached(path) == first
+        assert hashed == [path]
+
+        path.write_bytes(b'other')
+        assert _hash_file_cached(path) != first
+        assert hashed == [path, path]
+
+    def test_sdk_libraries_deduplicated(self, platform, toolchain, tmp_path):
+        """Test repeated SDK archives are linked once, in first-seen order."""
+        sdk_dir = tmp_path / 'sdk-dedup'
+        framework = Mock(spec=['get_sdk_dir', 'get_sdk_libs'])
+        framework.get_sdk_dir.return_value = sdk_dir
+        framework.get_sdk_libs.return_value = [sdk_dir / 'libb.a', sdk_dir / 'liba.a', sdk_dir / 'libb.a']
+        linker = ConfigurableLinker(
+            platform, toolchain, framework, 'esp32-s3-devkitc-1', tmp_path / 'build',
+            platform_config={}, show_progress=False,
+        )
+        assert linker.get_sdk_libraries() == [sdk_dir / 'libb.a', sdk_dir / 'liba.a']
+
+    def test_command_prefix_built_once(self, linker, toolchain, tmp_path):
+        """Test the linker, flags and scripts prefix is built once and reused."""
+        linker_path = toolchain.get_gxx_path.return_value
+        linker_path.parent.mkdir(parents=True)
+        linker_path.write_text('')
+        prefix = linker._get_command_prefix()
+        assert prefix[0] == str(linker_path)
+        assert prefix[1:3] == tuple(linker.get_linker_flags())
+        assert prefix[-1] == f"-T{tmp_path / 'imxrt1062.ld'}"
+        assert linker._get_command_prefix() is prefix
+        assert toolchain.get_gxx_path.call_count == 1
+
+    def test_size_tool_resolved_once(self, linker, toolchain, tmp_path):
+        """Test the size tool falls back to the .exe name and is looked up once."""
+        toolchain_bin = tmp_path / 'bin'
+        toolchain_bin.mkdir()
+        (toolchain_bin / 'arm-none-eabi-size.exe').write_text('')
+        toolchain.get_gcc_path.return_value = toolchain_bin / 'gcc'
+        linker._toolchain_get_size_path = None
+        assert linker._get_size_tool() == toolchain_bin / 'arm-none-eabi-size.exe'
+        assert linker._get_size_tool() == toolchain_bin / 'arm-none-eabi-size.exe'
+        assert toolchain.get_gcc_path.call_count == 1
+
+    def test_run_linker_timeout_kills_process(self, linker):
+        """Test a linker running past its timeout is killed and reported."""
+        cmd = [sys.executable, '-c', 'import time; time.sleep(30)']
+        with pytest.raises(subprocess.TimeoutExpired):
+            linker._run_linker(cmd, timeout=0.2)
@@ -0,0 +1,141 @@
+"""
+Unit tests for FlagBuilder class.
+
+Tests flag string parsing and compilation flag assembly.
+"""
+
+import pytest
+from fbuild.build.flag_builder import FlagBuilder
+
+
+class TestParseFlagString:
+    """Test suite for FlagBuilder.parse_flag_string."""
+
+    def test_plain_flags(self):
+        """Test whitespace-separated flags without quoting."""
+        assert FlagBuilder.parse_flag_string(' -Os  -g\t-DX=1 ') == ['-Os', '-g', '-DX=1']
+
+    def test_empty_string(self):
+        """Test empty flag string."""
+        assert FlagBuilder.parse_flag_string('') == []
+
+    def test_quoted_value(self):
+        """Test quoted values are kept together as a single flag."""
+        result = FlagBuilder.parse_flag_string('-DFOO="bar baz" -DTEST')
+        assert result == ['-DFOO=bar baz', '-DTEST']
+
+    def test_unbalanced_quote_falls_back(self):
+        """Test unbalanced quotes fall back to whitespace splitting."""
+        assert FlagBuilder.parse_flag_string('-DA="b -DC') == ['-DA="b', '-DC']
+
+
+class TestBuildFlags:
+    """Test suite for FlagBuilder.build_flags."""
+
+    @pytest.fixture
+    def builder(self):
+        """Create a FlagBuilder with a minimal config."""
+        config = {
+            'compiler_flags': {
+                'common': ['-Os'],
+                'c': ['-std=gnu17'],
+                'cxx': ['-std=gnu++2b'],
+            },
+            'defines': ['FOO', ['BAR', '1']],
+        }
+        board_config = {'build': {'f_cpu': '240000000L', 'extra_flags': '-DBOARD_EXTRA -mfix'}}
+        return FlagBuilder(
+            config=config,
+            board_config=board_config,
+            board_id='esp32-c6-devkitm-1',
+            variant='esp32c6',
+            user_build_flags=['-DUSER', '-Wall', '-Iinclude', '-O0'],
+        )
+
+    def test_language_flags(self, builder):
+        """Test language-specific flags are separated."""
+        flags = builder.build_flags()
+        assert flags['cflags'] == ('-std=gnu17',)
+        assert flags['cxxflags'] == ('-std=gnu++2b',)
+
+    def test_flags_built_once(self, builder):
+        """Test flags are built once and shared as immutable tuples."""
+        flags = builder.build_flags()
+        assert builder.build_flags() is flags
+        assert isinstance(flags['common'], tuple)
+
+    def test_common_flags(self, builder):
+        """Test defines, board and user flags are merged into common flags."""
+        common = builder.build_flags()['common']
+        assert common[0] == '-Os'
+        assert '-DFOO' in common
+        assert '-DBAR=1' in common
+        assert '-DF_CPU=240000000L' in common
+        assert '-DARDUINO_ESP32_C6_DEVKITM_1' in common
+        assert '-DARDUINO_VARIANT="esp32c6"' in common
+        assert '-DBOARD_EXTRA' in common
+        assert '-mfix' not in common
+        assert common[-3:] == ('-DUSER', '-Wall', '-Iinclude')
+        assert '-O0' not in common
+
+    def test_base_flags_for_library(self, builder):
+        """Test library base flags combine common and C++ flags."""
+        flags = builder.build_flags()
+        assert builder.get_base_flags_for_library() == list(flags['common'] + flags['cxxflags'])
+
+    def test_lto_flags(self, builder):
+        """Test LTO flags are only added when requested."""
+        from fbuild.build.flag_builder import LTO_COMPILE_FLAGS
+
+        assert '-flto=auto' not in builder.build_flags()['common']
+        lto_builder = FlagBuilder(
+            config=builder.config,
+            board_config=builder.board_config,
+            board_id=builder.board_id,
+            variant=builder.variant,
+            lto=True,
+        )
+        assert lto_builder.build_flags()['common'][-len(LTO_COMPILE_FLAGS):] == LTO_COMPILE_FLAGS
+
+    def test_separate_value_flags(self, builder):
+        """Test a bare -I/-D/-U is joined with the following argument."""
+        split_builder = FlagBuilder(
+            config=builder.config,
+            board_config={'build': {'extra_flags': '-D BOARD -mfix'}},
+            board_id=builder.board_id,
+            variant=builder.variant,
+            user_build_flags=['-I', '/opt/include', '-DFOO', '-U', 'BAR', '-D'],
+        )
+        common = split_builder.build_flags()['common']
+        assert '-DBOARD' in common
+        assert common[-3:] == ('-I/opt/include', '-DFOO', '-UBAR')
+
+    def test_relative_includes_resolved(self, builder, tmp_path):
+        """Test relative user include directories resolve against the project."""
+        project_builder = FlagBuilder(
+            config=builder.config,
+            board_config=builder.board_config,
+            board_id=builder.board_id,
+            variant=builder.variant,
+            user_build_flags=['-Iinclude', '-I', 'lib/inc', f'-I{tmp_path}'],
+            project_dir=tmp_path / 'project',
+        )
+        common = project_builder.build_flags()['common']
+        assert common[-3:] == (
+            f"-I{tmp_path / 'project' / 'include'}",
+            f"-I{tmp_path / 'project' / 'lib' / 'inc'}",
+            f'-I{tmp_path}',
+        )
+
+    def test_passthrough_w_options_dropped(self, builder):
+        """Test -Wl,/-Wa,/-Wp, options are not forwarded as warning flags."""
+        w_builder = FlagBuilder(
+            config=builder.config,
+            board_config=builder.board_config,
+            board_id=builder.board_id,
+            variant=builder.variant,
+            user_build_flags=['-Wl,--gc-sections', '-Wa,-a', '-Wp,-DX', '-Wextra', '-Wlogical-op'],
+        )
+        common = w_builder.build_flags()['common']
+        assert common[-2:] == ('-Wextra', '-Wlogical-op')
+        assert not any(flag.startswith(('-Wl,', '-Wa,', '-Wp,')) for flag in common)
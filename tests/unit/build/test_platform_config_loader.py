@@ -0,0 +1,51 @@
+"""
+Unit tests for platform config loading.
+
+Tests the JSON loader shared by the configurable compiler and linker.
+"""
+
+import os
+import pytest
+from fbuild.build.platform_config_loader import get_default_config_path, load_platform_config
+
+
+class TestPlatformConfigLoader:
+    """Test suite for platform config loading."""
+
+    def test_default_config_path(self):
+        """Test bundled configs are resolved by MCU name."""
+        config_path = get_default_config_path('esp32c6')
+        assert config_path.name == 'esp32c6.json'
+        assert config_path.parent.name == 'platform_configs'
+
+    def test_load_bundled_config(self):
+        """Test bundled config parses into a dictionary."""
+        config = load_platform_config(get_default_config_path('esp32c6'))
+        assert config['linker_scripts']
+        assert 'linker_scripts' in config
+
+    def test_load_config_path(self, tmp_path):
+        """Test loading an explicit config file."""
+        config_path = tmp_path / 'custom.json'
+        config_path.write_text('{"linker_flags": ["-nostartfiles"], "name": "caf\\u00e9"}', encoding='utf-8')
+        assert dict(load_platform_config(config_path)) == {'linker_flags': ['-nostartfiles'], 'name': 'café'}
+
+    def test_config_cached_until_modified(self, tmp_path):
+        """Test repeat loads reuse the parsed config until the file changes."""
+        config_path = tmp_path / 'custom.json'
+        config_path.write_text('{"linker_flags": ["-a"]}')
+        os.utime(config_path, ns=(1_000_000_000, 1_000_000_000))
+        config = load_platform_config(config_path)
+        assert load_platform_config(config_path) is config
+
+        config_path.write_text('{"linker_flags": ["-b"]}')
+        os.utime(config_path, ns=(2_000_000_000, 2_000_000_000))
+        assert dict(load_platform_config(config_path)) == {'linker_flags': ['-b']}
+
+    def test_config_is_read_only(self, tmp_path):
+        """Test the shared cached config cannot be modified."""
+        config_path = tmp_path / 'custom.json'
+        config_path.write_text('{"linker_flags": []}')
+        config = load_platform_config(config_path)
+        with pytest.raises(TypeError):
+            config['linker_flags'] = ['-x']
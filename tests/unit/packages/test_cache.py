@@ -76,6 +76,16 @@ class TestCache:
         cache = Cache()
         assert cache.libraries_dir == cache.cache_root / "libraries"
 
+    def test_core_archive_cache_dir(self):
+        """Test core archive cache directory property."""
+        cache = Cache()
+        assert cache.core_archive_cache_dir == cache.cache_root / "core_archive_cache"
+
+    def test_object_cache_dir(self):
+        """Test object cache directory property."""
+        cache = Cache()
+        assert cache.object_cache_dir == cache.cache_root / "obj_cache"
+
     def test_get_build_dir(self):
         """Test getting build directory for environment."""
         cache = Cache()
@@ -0,0 +1,34 @@
+"""Unit tests for ESP32 platform board lookups."""
+
+import pytest
+
+from fbuild.packages.cache import Cache
+from fbuild.packages.platform_esp32 import PlatformErrorESP32, PlatformESP32
+
+PLATFORM_URL = "https://github.com/pioarduino/platform-espressif32/releases/download/55.03.34/platform-espressif32.zip"
+
+
+class TestPlatformESP32BoardJson:
+    """Test cases for PlatformESP32.get_board_json."""
+
+    @pytest.fixture
+    def platform(self, tmp_path):
+        """Create platform with one board definition on disk."""
+        platform = PlatformESP32(Cache(tmp_path), PLATFORM_URL, show_progress=False)
+        boards_dir = platform.get_boards_dir()
+        boards_dir.mkdir(parents=True)
+        (boards_dir / "esp32-c6-devkitm-1.json").write_text('{"build": {"mcu": "esp32c6"}}')
+        return platform
+
+    def test_board_json_parsed_once(self, platform):
+        """Test repeat lookups reuse the parsed board definition."""
+        board_json = platform.get_board_json("esp32-c6-devkitm-1")
+        assert board_json["build"]["mcu"] == "esp32c6"
+
+        (platform.get_boards_dir() / "esp32-c6-devkitm-1.json").unlink()
+        assert platform.get_board_json("esp32-c6-devkitm-1") is board_json
+
+    def test_missing_board(self, platform):
+        """Test unknown boards raise a platform error."""
+        with pytest.raises(PlatformErrorESP32, match="Board definition not found"):
+            platform.get_board_json("no-such-board")
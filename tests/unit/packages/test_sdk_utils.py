@@ -0,0 +1,32 @@
+"""
+Unit tests for SDKPathResolver.
+
+Tests MCU fallback and SDK library discovery.
+"""
+
+from fbuild.packages.sdk_utils import SDKPathResolver
+
+
+class TestSDKPathResolver:
+    """Test suite for SDKPathResolver."""
+
+    def test_get_sdk_libs(self, tmp_path):
+        """Test main and flash-mode libraries are collected."""
+        (tmp_path / "esp32s3" / "lib").mkdir(parents=True)
+        (tmp_path / "esp32s3" / "qio_qspi").mkdir()
+        (tmp_path / "esp32s3" / "lib" / "libnet.a").write_text("")
+        (tmp_path / "esp32s3" / "lib" / "readme.txt").write_text("")
+        (tmp_path / "esp32s3" / "qio_qspi" / "libspi_flash.a").write_text("")
+
+        libs = SDKPathResolver(tmp_path, show_progress=False).get_sdk_libs("esp32s3", "qio")
+        assert sorted(lib.name for lib in libs) == ["libnet.a", "libspi_flash.a"]
+        assert tmp_path / "esp32s3" / "lib" / "libnet.a" in libs
+
+    def test_get_sdk_libs_missing_dirs(self, tmp_path):
+        """Test missing library directories yield no libraries."""
+        assert SDKPathResolver(tmp_path, show_progress=False).get_sdk_libs("esp32c6") == []
+
+    def test_mcu_fallback(self, tmp_path):
+        """Test esp32c2 falls back to the esp32c3 SDK."""
+        (tmp_path / "esp32c3").mkdir()
+        assert SDKPathResolver(tmp_path, show_progress=False)._resolve_mcu("esp32c2") == "esp32c3"